@@ -1,5 +1,6 @@
 # sphinx_openapi/__init__.py
 from sphinx.application import Sphinx
+from .serialization import YAML_BACKEND
 from .sphinx_openapi import SphinxOpenApi
 import importlib.metadata
 from pathlib import Path
@@ -19,10 +20,34 @@ def setup(app: Sphinx) -> dict:
     app.add_config_value("openapi_stop_build_on_error", False, "env")
     app.add_config_value("openapi_debug_stop_on_done", False, "env")
     app.add_config_value("openapi_combined_schema_file_path", None, "env")
+    app.add_config_value("openapi_max_workers", 4, "env")
+    app.add_config_value("openapi_http_pool_size", 10, "env")
+    app.add_config_value("openapi_http_keep_alive", True, "env")
+    app.add_config_value("openapi_http_revalidate", True, "env")
+    app.add_config_value("openapi_cache_dir", None, "env")
+    app.add_config_value("openapi_incremental_merge", True, "env")
+    app.add_config_value("openapi_streaming_merge", False, "env")
+    app.add_config_value("openapi_merge_store_threshold", 500, "env")
+    app.add_config_value("openapi_prune_unused_components", False, "env")
+    app.add_config_value("openapi_minified_json", False, "env")
+    app.add_config_value("openapi_precompress", False, "env")
+    app.add_config_value("openapi_chunked_output", None, "env")
+    app.add_config_value("openapi_max_spec_bytes", None, "env")
+    app.add_config_value("openapi_retry_attempts", 3, "env")
+    app.add_config_value("openapi_retry_backoff", 0.5, "env")
+    app.add_config_value("openapi_retry_max_delay", 30.0, "env")
+    app.add_config_value("openapi_circuit_breaker_threshold", 3, "env")
+    app.add_config_value("openapi_offline", False, "env")
+    app.add_config_value("openapi_stale_while_revalidate", False, "env")
+    app.add_config_value("openapi_revalidate_timeout", 30.0, "env", types=(int, float))
+    app.add_config_value("openapi_prefetch", True, "env")
 
     openapi_ext = SphinxOpenApi(app)
+    app.connect("config-inited", openapi_ext.prefetch_openapi)
     app.connect("builder-inited", openapi_ext.setup_openapi)
-    print(f"[sphinx_openapi] Extension loaded with version: {__version__}")
+    app.connect("env-before-read-docs", openapi_ext.finish_openapi)
+    app.connect("build-finished", openapi_ext.join_revalidation)
+    print(f"[sphinx_openapi] Extension loaded with version: {__version__} (YAML backend: {YAML_BACKEND})")
     return {
         "version": __version__,
         "parallel_read_safe": True,
@@ -0,0 +1,111 @@
+# sphinx_openapi/atomic_io.py
+import os
+import shutil
+import stat
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+# Mode of a newly created file, probed once on first use (see `_default_file_mode`).
+_default_mode: int | None = None
+_default_mode_lock = threading.Lock()
+
+
+def _default_file_mode() -> int:
+    """
+    Returns the permission bits a plain `open(path, "w")` creates under the current umask.
+    Found by creating a probe file, since `os.umask` can only be queried by changing the
+    process-wide umask, which would race with other threads creating files.
+    """
+    global _default_mode
+    with _default_mode_lock:
+        if _default_mode is None:
+            probe = Path(tempfile.gettempdir()) / f".sphinx_openapi-umask-{os.getpid()}-{threading.get_ident()}"
+            try:
+                fd = os.open(probe, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666)
+            except OSError:
+                return 0o644  # Temp dir not writable; assume the common umask of 022
+            try:
+                _default_mode = stat.S_IMODE(os.fstat(fd).st_mode)
+            finally:
+                os.close(fd)
+                probe.unlink(missing_ok=True)
+        return _default_mode
+
+
+def replacement_mode(path: Path) -> int:
+    """
+    Returns the permission bits for a file replacing `path`: those of the existing file,
+    or what a plain `open(path, "w")` would create (mkstemp files are private by default).
+    """
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except OSError:
+        return _default_file_mode()
+
+
+@contextmanager
+def atomic_output(path: Path) -> Iterator[tuple[BinaryIO, Path]]:
+    """
+    Yields (file, temp path) for a temp file in `path`'s directory, which replaces `path` via `os.replace`
+    when the block exits normally. Readers never observe a partial file: they see either the old or the
+    new content. On error the temp file is removed and `path` is left untouched.
+    Replacing also never writes through a hardlink (e.g. into the shared spec cache).
+    """
+    path = Path(path)
+    f, tmp_path = create_temp(path)
+    try:
+        with f:
+            yield f, tmp_path
+        commit_temp(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def create_temp(path: Path, suffix: str = ".tmp") -> tuple[BinaryIO, Path]:
+    """
+    Creates and opens a hidden temp file in `path`'s directory (so it can later be moved over `path`
+    with `commit_temp`). The caller owns the file and must remove it if it is not committed.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=suffix)
+    return os.fdopen(fd, "wb"), Path(tmp_name)
+
+
+def commit_temp(tmp_path: Path, path: Path) -> None:
+    """
+    Atomically moves a finished temp file from `create_temp` over `path`.
+    """
+    os.chmod(tmp_path, replacement_mode(Path(path)))
+    os.replace(tmp_path, path)
+
+
+def write_atomic(path: Path, content: bytes) -> None:
+    """
+    Writes `content` to `path` via a temp file in the same directory and `os.replace`.
+    """
+    with atomic_output(path) as (f, _):
+        f.write(content)
+
+
+def link_or_copy_atomic(source: Path, path: Path) -> None:
+    """
+    Atomically replaces `path` with a hardlink to `source` (same filesystem), falling back to a copy.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.link")
+    try:
+        tmp_path.unlink(missing_ok=True)
+        os.link(source, tmp_path)
+        os.replace(tmp_path, path)
+        return
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+    with atomic_output(path) as (f, _):
+        with open(source, "rb") as src:
+            shutil.copyfileobj(src, f)
@@ -0,0 +1,73 @@
+# sphinx_openapi/circuit_breaker.py
+import threading
+from urllib.parse import urlsplit
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker for a single build. After `threshold` consecutive sources on a host
+    fail at the host level (timeouts, connection errors, after their retries), its circuit opens and the
+    remaining requests to that host are short-circuited instead of each waiting out its own timeout.
+    Any HTTP response from the host resets its count. Thread-safe, since specs are fetched in parallel.
+    """
+
+    def __init__(self, threshold: int) -> None:
+        self.threshold: int = max(1, threshold)
+        self._lock = threading.Lock()
+        self._failures: dict[str, int] = {}  # host -> consecutive failures
+        self._open: set[str] = set()
+        self._skipped: dict[str, list[str]] = {}  # host -> sources short-circuited
+
+    @staticmethod
+    def host(source: str) -> str:
+        """
+        Returns the host (with port) of a URL source.
+        """
+        return urlsplit(source).netloc.lower()
+
+    def allow(self, source: str) -> bool:
+        """
+        Returns True if a request to `source` may be made; otherwise records it as skipped.
+        """
+        host = self.host(source)
+        with self._lock:
+            if host not in self._open:
+                return True
+            self._skipped.setdefault(host, []).append(source)
+            return False
+
+    def is_open(self, source: str) -> bool:
+        """
+        Returns True if the circuit for `source`'s host is open.
+        """
+        with self._lock:
+            return self.host(source) in self._open
+
+    def record_success(self, source: str) -> None:
+        """
+        Resets the failure count of `source`'s host.
+        """
+        with self._lock:
+            self._failures.pop(self.host(source), None)
+
+    def record_failure(self, source: str) -> bool:
+        """
+        Counts a source whose download failed at the host level. Returns True if this opened the circuit.
+        """
+        host = self.host(source)
+        with self._lock:
+            self._failures[host] = self._failures.get(host, 0) + 1
+            if host in self._open or self._failures[host] < self.threshold:
+                return False
+            self._open.add(host)
+            return True
+
+    def report(self) -> list[tuple[str, int, list[str]]]:
+        """
+        Returns (host, consecutive failures, skipped sources) for every open circuit, sorted by host.
+        """
+        with self._lock:
+            return [
+                (host, self._failures.get(host, 0), list(self._skipped.get(host, [])))
+                for host in sorted(self._open)
+            ]
@@ -4,6 +4,7 @@ from pathlib import Path
 from types import SimpleNamespace
 
 from sphinx_openapi import SphinxOpenApi
+from sphinx_openapi.sphinx_openapi import OfflineCacheMissError
 from models.schema_info import SchemaInfo
 
 
@@ -80,8 +81,34 @@ def main() -> None:
             "defaults to './combined_openapi.yaml'. If omitted, no combined file is produced."
         ),
     )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=None,
+        help=(
+            "Optional shared spec cache directory. Downloaded specs are stored by content hash and "
+            "hardlinked/copied into the destination directory, so repeated builds reuse them."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=4,
+        help="Maximum number of schemas to download and process in parallel. Use 1 to process sequentially.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help=(
+            "Do not access the network: resolve URL sources from the spec cache (--cache-dir) or existing "
+            "destination files, failing if any source has no cached copy."
+        ),
+    )
     args = parser.parse_args()
 
+    if args.jobs < 1:
+        parser.error(f"--jobs must be at least 1, got: {args.jobs}")
+
     if args.dest_dir.exists():
         if not args.dest_dir.is_dir():
             parser.error(f"--dest-dir must be a directory, got file: {args.dest_dir}")
@@ -94,11 +121,36 @@ def main() -> None:
         openapi_spec_list=schema_info_list,
         openapi_use_xbe_workarounds=args.use_xbe_workarounds,
         openapi_stop_build_on_error=False,
+        openapi_debug_stop_on_done=False,
         openapi_combined_schema_file_path=args.combined_schema_file,
+        openapi_max_workers=args.jobs,
+        openapi_http_pool_size=10,
+        openapi_http_keep_alive=True,
+        openapi_http_revalidate=True,
+        openapi_cache_dir=args.cache_dir,
+        openapi_incremental_merge=True,
+        openapi_streaming_merge=False,
+        openapi_merge_store_threshold=500,
+        openapi_prune_unused_components=False,
+        openapi_minified_json=False,
+        openapi_precompress=False,
+        openapi_chunked_output=None,
+        openapi_max_spec_bytes=None,
+        openapi_retry_attempts=3,
+        openapi_retry_backoff=0.5,
+        openapi_retry_max_delay=30.0,
+        openapi_circuit_breaker_threshold=3,
+        openapi_offline=args.offline,
+        openapi_stale_while_revalidate=False,
+        openapi_revalidate_timeout=30.0,
+        openapi_prefetch=False,
     )
     dummy_app = DummyApp(config)
     openapi_ext = SphinxOpenApi(dummy_app)  # type: ignore
-    openapi_ext.setup_openapi(dummy_app)  # type: ignore
+    try:
+        openapi_ext.setup_openapi(dummy_app)  # type: ignore
+    except OfflineCacheMissError as e:
+        parser.exit(1, f"{e}\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,83 @@
+# sphinx_openapi/merge_state.py
+from pathlib import Path
+
+from sphinx_openapi.atomic_io import write_atomic
+from sphinx_openapi.serialization import dump_state, load_state
+
+
+class MergeState:
+    """
+    Per-spec merge contributions (see SpecMerger.add_spec) from the last combine, keyed by content hash.
+    Stored as a hidden `.<combined name>.merge-state.json` next to the combined file, so the next build
+    can splice unchanged specs back in instead of re-parsing and re-merging them.
+    Written with `dump_state`: data-only JSON that keeps YAML-only types such as integer keys and dates
+    intact, so loading a state file (which may sit in the docs source tree) never runs code.
+    """
+
+    VERSION = 2
+
+    def __init__(
+        self,
+        output_path: Path,
+        entries: list[dict],
+        output_sha256: str | None = None,
+        options: dict | None = None,
+    ) -> None:
+        self.output_path: Path = Path(output_path)
+        # One entry per configured spec, in order: {"source", "digest", "contribution"}.
+        # digest / contribution are None if the spec could not be read or parsed.
+        self.entries: list[dict] = entries
+        self.output_sha256: str | None = output_sha256
+        # Output-affecting settings the combined file was written with (e.g. component pruning).
+        self.options: dict | None = options
+
+    @staticmethod
+    def state_path(output_path: Path) -> Path:
+        """
+        Returns the state file path for the given combined output path.
+        """
+        output_path = Path(output_path)
+        return output_path.with_name(f".{output_path.name}.merge-state.json")
+
+    @staticmethod
+    def legacy_state_path(output_path: Path) -> Path:
+        """
+        Returns the pickle state file path used by earlier versions; it is never loaded, only removed.
+        """
+        output_path = Path(output_path)
+        return output_path.with_name(f".{output_path.name}.merge-state.pickle")
+
+    @classmethod
+    def load(cls, output_path: Path) -> "MergeState | None":
+        """
+        Loads the state saved for `output_path`, or None if there is none or it is unreadable/outdated.
+        """
+        try:
+            data = load_state(cls.state_path(output_path).read_bytes())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get("version") != cls.VERSION:
+            return None
+        try:
+            return cls(output_path, data["entries"], data["output_sha256"], data.get("options"))
+        except KeyError:
+            return None
+
+    def save(self) -> None:
+        """
+        Writes the state next to the combined output.
+        """
+        data = {
+            "version": self.VERSION,
+            "entries": self.entries,
+            "output_sha256": self.output_sha256,
+            "options": self.options,
+        }
+        write_atomic(self.state_path(self.output_path), dump_state(data))
+        self.legacy_state_path(self.output_path).unlink(missing_ok=True)
+
+    def sources(self) -> list[str]:
+        """
+        Returns the spec sources the state was recorded for, in order.
+        """
+        return [entry["source"] for entry in self.entries]
@@ -0,0 +1,210 @@
+# sphinx_openapi/merge_store.py
+import sqlite3
+from pathlib import Path
+from typing import Iterator
+
+from sphinx_openapi.serialization import dump_state, load_state
+from sphinx_openapi.spec_merger import SpecMerger
+
+
+class MergeStore:
+    """
+    SQLite-backed store of merged paths and components, keyed by (section, merged name) with their
+    structural hash, for combining spec sets too large to hold in memory.
+    Stored as a hidden `.<combined name>.merge-store.sqlite` next to the combined file. Every spec is
+    committed in its own transaction together with its source and content hash, so an interrupted
+    combine resumes after the last merged spec, and a later build only re-merges from the first spec
+    whose source or content changed. Values are stored as data-only JSON (`dump_state`), as in MergeState.
+    """
+
+    VERSION = 2
+
+    def __init__(self, output_path: Path) -> None:
+        self.output_path: Path = Path(output_path)
+        self.path: Path = self.store_path(self.output_path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            self.conn: sqlite3.Connection = self._connect()
+            version = self.get_meta("version")
+        except sqlite3.DatabaseError:
+            self.conn, version = None, None
+        if version != self.VERSION:
+            # Missing, corrupt or written by another version: start over.
+            if self.conn is not None:
+                self.conn.close()
+            for suffix in ("", "-wal", "-shm"):
+                Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+            self.conn = self._connect()
+        self._create_tables()
+
+    @staticmethod
+    def store_path(output_path: Path) -> Path:
+        """
+        Returns the store file path for the given combined output path.
+        """
+        output_path = Path(output_path)
+        return output_path.with_name(f".{output_path.name}.merge-store.sqlite")
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Opens the database in WAL mode, trading per-commit fsyncs for speed (a lost tail is simply re-merged).
+        """
+        conn = sqlite3.connect(self.path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _create_tables(self) -> None:
+        """
+        Creates the meta, sources and items tables if they do not exist yet.
+        """
+        with self.conn:
+            self.conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value BLOB);
+                CREATE TABLE IF NOT EXISTS sources (
+                    position INTEGER PRIMARY KEY,
+                    source TEXT NOT NULL,
+                    digest TEXT,
+                    openapi BLOB,
+                    info BLOB,
+                    deduplicated_count INTEGER NOT NULL DEFAULT 0,
+                    deduplicated_bytes INTEGER NOT NULL DEFAULT 0
+                );
+                CREATE TABLE IF NOT EXISTS items (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    position INTEGER NOT NULL,
+                    section TEXT NOT NULL,
+                    item_key TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    hash TEXT,
+                    value BLOB NOT NULL,
+                    UNIQUE (section, name)
+                );
+                CREATE INDEX IF NOT EXISTS items_position ON items (position);
+                CREATE INDEX IF NOT EXISTS items_hash ON items (section, hash);
+                """
+            )
+            self.conn.execute(
+                "INSERT OR IGNORE INTO meta (key, value) VALUES ('version', ?)", (dump_state(self.VERSION),)
+            )
+
+    def get_meta(self, key: str):
+        """
+        Returns a stored metadata value, or None if it is missing (or the store is not initialized yet).
+        """
+        try:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        except sqlite3.DatabaseError:
+            return None
+        if not row:
+            return None
+        try:
+            return load_state(row[0])
+        except ValueError:
+            return None  # e.g. a value pickled by an earlier version, which is never unpickled
+
+    def set_meta(self, key: str, value) -> None:
+        """
+        Stores a metadata value.
+        """
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, dump_state(value)))
+
+    def merged_sources(self) -> list[tuple[str, str | None]]:
+        """
+        Returns the (source, content digest) of every spec merged so far, in merge order.
+        """
+        return list(self.conn.execute("SELECT source, digest FROM sources ORDER BY position"))
+
+    def truncate(self, position: int) -> None:
+        """
+        Forgets every spec merged at `position` or later, along with the paths and components they added.
+        """
+        with self.conn:
+            self.conn.execute("DELETE FROM items WHERE position >= ?", (position,))
+            self.conn.execute("DELETE FROM sources WHERE position >= ?", (position,))
+            self.conn.execute("DELETE FROM meta WHERE key = 'output_sha256'")
+
+    def restore(self, merger: SpecMerger) -> None:
+        """
+        Replays the stored merge state into a merger created with keep_values=False,
+        registering names and structural hashes only (values stay on disk).
+        """
+        for openapi, info, dedup_count, dedup_bytes in self.conn.execute(
+            "SELECT openapi, info, deduplicated_count, deduplicated_bytes FROM sources ORDER BY position"
+        ):
+            if merger.openapi is None and openapi is not None:
+                merger.openapi = load_state(openapi)
+                merger.info = load_state(info)
+            merger.deduplicated_count += dedup_count
+            merger.deduplicated_bytes += dedup_bytes
+        for section, item_key, name, item_hash in self.conn.execute(
+            "SELECT section, item_key, name, hash FROM items ORDER BY seq"
+        ):
+            merger.restore_item(section, item_key, name, item_hash)
+
+    def add(self, position: int, source: str, digest: str | None, contribution: dict | None) -> None:
+        """
+        Records a spec's merge contribution (see SpecMerger.add_spec), or just its source if it could
+        not be merged, in a single transaction.
+        """
+        with self.conn:
+            if contribution is None:
+                self.conn.execute(
+                    "INSERT INTO sources (position, source, digest) VALUES (?, ?, ?)", (position, source, digest)
+                )
+                return
+            self.conn.execute(
+                "INSERT INTO sources VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    position,
+                    source,
+                    digest,
+                    dump_state(contribution["openapi"]),
+                    dump_state(contribution["info"]),
+                    contribution["deduplicated_count"],
+                    contribution["deduplicated_bytes"],
+                ),
+            )
+            rows = [
+                (position, "paths", name, name, None, dump_state(path_item))
+                for name, path_item in contribution["paths"]
+            ]
+            rows.extend(
+                (
+                    position,
+                    comp_key,
+                    item_key,
+                    name,
+                    item_hash or SpecMerger.structural_hash(item_val),
+                    dump_state(item_val),
+                )
+                for comp_key, item_key, name, item_hash, item_val in contribution["components"]
+                if item_val is not None
+            )
+            self.conn.executemany(
+                "INSERT INTO items (position, section, item_key, name, hash, value) VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+
+    def header(self) -> tuple[str, dict] | None:
+        """
+        Returns the 'openapi' version and 'info' of the first merged spec, or None if no spec merged.
+        """
+        row = self.conn.execute(
+            "SELECT openapi, info FROM sources WHERE openapi IS NOT NULL ORDER BY position LIMIT 1"
+        ).fetchone()
+        return (load_state(row[0]), load_state(row[1])) if row else None
+
+    def items(self) -> Iterator[tuple[str, str, object]]:
+        """
+        Yields every merged (section, name, value) in merge order, one row at a time.
+        """
+        for section, name, value in self.conn.execute("SELECT section, name, value FROM items ORDER BY seq"):
+            yield section, name, load_state(value)
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self.conn.close()
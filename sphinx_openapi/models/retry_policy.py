@@ -0,0 +1,62 @@
+# models/retry_policy.py
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Statuses worth retrying: rate limiting and transient gateway/server errors.
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+class RetryPolicy:
+    """
+    How often and how long to retry a failed spec download (timeouts, connection errors
+    and the statuses in `retry_statuses`). Waits grow exponentially from `backoff` seconds,
+    with full jitter, and never exceed `max_delay`. A `Retry-After` header (429 / 503) is honored
+    instead of the backoff; if it asks for longer than `max_delay`, the download is not retried.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff: float = 0.5,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+        retry_statuses: tuple[int, ...] = DEFAULT_RETRY_STATUSES,
+    ) -> None:
+        self.max_attempts: int = max(1, max_attempts)
+        self.backoff: float = backoff
+        self.max_delay: float = max_delay
+        self.jitter: bool = jitter
+        self.retry_statuses: tuple[int, ...] = tuple(retry_statuses)
+
+    def delay(self, attempt: int, retry_after: str | None = None) -> float | None:
+        """
+        Returns the seconds to wait before the attempt after `attempt` (1-based),
+        or None if no attempts are left or the server asked to wait longer than `max_delay`.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        requested = self.parse_retry_after(retry_after)
+        if requested is not None:
+            return requested if requested <= self.max_delay else None
+        delay = min(self.max_delay, self.backoff * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    @staticmethod
+    def parse_retry_after(value: str | None) -> float | None:
+        """
+        Parses a `Retry-After` header (delay in seconds or an HTTP date) into seconds from now.
+        """
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
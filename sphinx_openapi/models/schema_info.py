@@ -1,13 +1,38 @@
 # models/schema_info.py
 from pathlib import Path
 
+from sphinx_openapi.models.retry_policy import RetryPolicy
+
 
 class SchemaInfo:
     """
     Represents an OpenAPI schema with its source (URL or file path) 
-    and destination file path.
+    and destination file path. `retry` overrides the global `openapi_retry_*` policy for this source.
     """
 
-    def __init__(self, source: str, dest: Path) -> None:
+    def __init__(self, source: str, dest: Path, retry: RetryPolicy | None = None) -> None:
         self.source: str = source
         self.dest: Path = dest
+        self.retry: RetryPolicy | None = retry
+        # In-memory pipeline state, populated while the extension processes this schema.
+        self.content: bytes | None = None  # Bytes to be written to dest (raw download, or re-serialized spec)
+        self.spec: dict | None = None  # Parsed spec, set the first time it is needed
+        self.response_headers = None  # Headers of a fresh (non-304) HTTP response
+        # A fresh HTTP body is streamed to a temp file next to dest instead of into `content`.
+        self.download_path: Path | None = None
+        self.content_sha256: str | None = None  # sha256 of the streamed body, computed while downloading
+        self.not_modified: bool = False  # True if the server answered 304 Not Modified
+        self.from_cache: bool = False  # True if the last known copy was used without a request
+        # Set after processing: True if dest was rewritten, False if unchanged, None if processing failed.
+        self.changed: bool | None = None
+
+    def release(self) -> None:
+        """
+        Drops the in-memory content and parsed spec once outputs have been written.
+        """
+        self.content = None
+        self.spec = None
+        self.response_headers = None
+        self.content_sha256 = None
+        self.not_modified = False
+        self.from_cache = False
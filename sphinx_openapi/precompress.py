@@ -0,0 +1,122 @@
+# sphinx_openapi/precompress.py
+import gzip
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable
+
+import orjson
+
+from sphinx_openapi.atomic_io import write_atomic
+
+# Brotli is optional; without it only .gz siblings are written.
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+class Precompressor:
+    """
+    Writes precompressed siblings (`<name>.gz`, plus `<name>.br` when the `brotli` package is installed)
+    of output files, for static hosts that serve precompressed assets.
+    Each directory keeps a hidden `.precompressed.json` manifest of the sha256 each file's siblings were
+    built from, so unchanged files are not recompressed. Files are compressed in parallel threads
+    (zlib and brotli release the GIL while compressing).
+    """
+
+    MANIFEST_NAME = ".precompressed.json"
+
+    def __init__(self, max_workers: int = 4) -> None:
+        self.max_workers: int = max(1, max_workers or 1)
+        self.encodings: dict[str, Callable[[bytes], bytes]] = {".gz": self._gzip}
+        if brotli is not None:
+            self.encodings[".br"] = self._brotli
+
+    @staticmethod
+    def _gzip(content: bytes) -> bytes:
+        """
+        Returns `content` gzip-compressed at the highest level.
+        """
+        # mtime=0 keeps the output byte-identical across builds.
+        return gzip.compress(content, compresslevel=9, mtime=0)
+
+    @staticmethod
+    def _brotli(content: bytes) -> bytes:
+        """
+        Returns `content` brotli-compressed at the highest quality.
+        """
+        return brotli.compress(content, quality=11)
+
+    def run(self, paths: list[Path]) -> tuple[int, int, list[tuple[Path, Exception]]]:
+        """
+        Compresses every existing file in `paths` whose content changed since its siblings were written.
+        Returns (files compressed, files skipped as unchanged, [(file, error)] for files that failed).
+        """
+        paths = [Path(path) for path in dict.fromkeys(paths) if Path(path).is_file()]
+        manifests = {directory: self._load_manifest(directory) for directory in {path.parent for path in paths}}
+        max_workers = min(self.max_workers, len(paths)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sphinx_openapi_compress") as executor:
+            results = list(
+                executor.map(lambda path: self._compress(path, manifests[path.parent].get(path.name)), paths)
+            )
+
+        compressed = skipped = 0
+        failed: list[tuple[Path, Exception]] = []
+        updated_dirs = set()
+        for path, result in zip(paths, results):
+            if isinstance(result, Exception):
+                failed.append((path, result))
+            elif result is None:
+                skipped += 1
+            else:
+                manifests[path.parent][path.name] = result
+                updated_dirs.add(path.parent)
+                compressed += 1
+        for directory in updated_dirs:
+            self._save_manifest(directory, manifests[directory])
+        return compressed, skipped, failed
+
+    def _compress(self, path: Path, recorded_digest: str | None) -> str | Exception | None:
+        """
+        Writes the siblings of `path` unless they were built from its current content.
+        Returns the content digest if siblings were written, None if they were up to date,
+        or the error if compression failed.
+        """
+        try:
+            return self._compress_file(path, recorded_digest)
+        except Exception as e:
+            return e
+
+    def _compress_file(self, path: Path, recorded_digest: str | None) -> str | None:
+        """
+        Does the work of `_compress`, raising on failure.
+        """
+        content = path.read_bytes()
+        digest = hashlib.sha256(content).hexdigest()
+        siblings = {suffix: path.with_name(path.name + suffix) for suffix in self.encodings}
+        if digest == recorded_digest and all(sibling.exists() for sibling in siblings.values()):
+            return None
+        for suffix, sibling in siblings.items():
+            write_atomic(sibling, self.encodings[suffix](content))
+        return digest
+
+    @classmethod
+    def _load_manifest(cls, directory: Path) -> dict[str, str]:
+        """
+        Returns a directory's {file name: sha256} manifest, or an empty one if missing or unreadable.
+        """
+        try:
+            manifest = orjson.loads((directory / cls.MANIFEST_NAME).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    @classmethod
+    def _save_manifest(cls, directory: Path, manifest: dict[str, str]) -> None:
+        """
+        Writes a directory's manifest atomically.
+        """
+        write_atomic(
+            directory / cls.MANIFEST_NAME, orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
@@ -0,0 +1,157 @@
+# sphinx_openapi/serialization.py
+import base64
+import datetime
+import math
+from pathlib import Path
+
+import orjson
+import yaml
+
+# Prefer PyYAML's libyaml bindings (an order of magnitude faster on large specs), falling back to pure Python.
+try:
+    from yaml import CSafeDumper as YamlSafeDumper
+    from yaml import CSafeLoader as YamlSafeLoader
+
+    YAML_BACKEND = "libyaml"
+except ImportError:
+    from yaml import SafeDumper as YamlSafeDumper
+    from yaml import SafeLoader as YamlSafeLoader
+
+    YAML_BACKEND = "pure-Python"
+
+
+def load_yaml(content: bytes | str):
+    """
+    Parses YAML with the fastest available safe loader; equivalent to `yaml.safe_load`.
+    """
+    return yaml.load(content, Loader=YamlSafeLoader)
+
+
+def dump_yaml(data) -> bytes:
+    """
+    Serializes data to UTF-8 YAML bytes with the fastest available safe dumper; equivalent to `yaml.safe_dump`.
+    """
+    return yaml.dump(data, Dumper=YamlSafeDumper).encode("utf-8")
+
+
+def is_json(content: bytes, content_type: str | None = None) -> bool:
+    """
+    Returns True if the spec looks like JSON: a JSON content type, or a leading '{' / '['.
+    """
+    if content_type and "json" in content_type.lower():
+        return True
+    return content.lstrip()[:1] in (b"{", b"[")
+
+
+def load_spec(content: bytes, content_type: str | None = None):
+    """
+    Parses a JSON or YAML spec. JSON goes through orjson; anything else (including YAML flow
+    mappings that merely start with '{') falls back to the YAML loader.
+    """
+    if is_json(content, content_type):
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return load_yaml(content)
+
+
+def dump_spec(data, path: Path) -> bytes:
+    """
+    Serializes a spec in the format implied by the destination's extension:
+    `.json` via orjson (2-space indented), anything else as YAML.
+    """
+    if Path(path).suffix.lower() == ".json":
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return dump_yaml(data)
+
+
+def dump_minified_json(data) -> bytes:
+    """
+    Serializes data to compact single-line JSON via orjson, the fastest format for browsers to parse.
+    """
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def minified_json_path(path: Path) -> Path:
+    """
+    Returns the path of the minified JSON twin of an output file (`spec.yaml` -> `spec.min.json`).
+    """
+    path = Path(path)
+    return path.with_name(f"{path.stem}.min.json")
+
+
+# Key marking a tagged value in `dump_state` output; never a plain dict key (dicts using it are tagged as maps).
+_STATE_TAG = "__sphinx_openapi_type__"
+
+
+def dump_state(data) -> bytes:
+    """
+    Serializes build state (merge contributions) to data-only JSON. Values JSON cannot represent exactly
+    are written as tagged objects: tuples, dates/datetimes, non-finite floats, ints beyond 64 bits,
+    binary, sets, and dicts with non-string keys (YAML allows e.g. integer keys), so `load_state`
+    restores them unchanged. Unlike pickle, loading the output can never run code.
+    """
+    return orjson.dumps(_encode_state(data))
+
+
+def load_state(content: bytes):
+    """
+    Parses `dump_state` output. Raises ValueError (orjson.JSONDecodeError) if it is not valid state.
+    """
+    return _decode_state(orjson.loads(content))
+
+
+def _encode_state(value):
+    if isinstance(value, dict):
+        if all(type(key) is str for key in value) and _STATE_TAG not in value:
+            return {key: _encode_state(item) for key, item in value.items()}
+        return {_STATE_TAG: "map", "v": [[_encode_state(key), _encode_state(item)] for key, item in value.items()]}
+    if isinstance(value, list):
+        return [_encode_state(item) for item in value]
+    if value is None or isinstance(value, (str, bool)):
+        return value
+    if isinstance(value, int):
+        return value if -(2**63) <= value < 2**64 else {_STATE_TAG: "int", "v": str(value)}
+    if isinstance(value, float):
+        return value if math.isfinite(value) else {_STATE_TAG: "float", "v": repr(value)}
+    if isinstance(value, tuple):
+        return {_STATE_TAG: "tuple", "v": [_encode_state(item) for item in value]}
+    if isinstance(value, datetime.datetime):
+        return {_STATE_TAG: "datetime", "v": value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {_STATE_TAG: "date", "v": value.isoformat()}
+    if isinstance(value, bytes):
+        return {_STATE_TAG: "bytes", "v": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, (set, frozenset)):
+        return {_STATE_TAG: "set", "v": [_encode_state(item) for item in value]}
+    raise TypeError(f"Unsupported type in build state: {type(value).__name__}")
+
+
+def _decode_state(value):
+    if isinstance(value, list):
+        return [_decode_state(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    tag = value.get(_STATE_TAG)
+    if tag is None:
+        return {key: _decode_state(item) for key, item in value.items()}
+    encoded = value["v"]
+    if tag == "map":
+        return {_decode_state(key): _decode_state(item) for key, item in encoded}
+    if tag == "tuple":
+        return tuple(_decode_state(item) for item in encoded)
+    if tag == "datetime":
+        return datetime.datetime.fromisoformat(encoded)
+    if tag == "date":
+        return datetime.date.fromisoformat(encoded)
+    if tag == "int":
+        return int(encoded)
+    if tag == "float":
+        return float(encoded)
+    if tag == "bytes":
+        return base64.b64decode(encoded)
+    if tag == "set":
+        return {_decode_state(item) for item in encoded}
+    raise ValueError(f"Unknown build state tag: {tag!r}")
+
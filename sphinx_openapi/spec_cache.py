@@ -0,0 +1,172 @@
+# sphinx_openapi/spec_cache.py
+import hashlib
+from pathlib import Path
+
+import orjson
+
+from sphinx_openapi.atomic_io import link_or_copy_atomic, write_atomic
+
+# Read size when hashing files.
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+class HttpValidators:
+    """
+    On-disk store of HTTP cache validators (ETag / Last-Modified) for downloaded specs.
+    Each SchemaInfo.dest gets a hidden `.<name>.meta.json` sidecar, which Sphinx skips when copying static files.
+    """
+
+    @staticmethod
+    def meta_path(dest: Path) -> Path:
+        """
+        Returns the sidecar metadata path for the given destination file.
+        """
+        return dest.with_name(f".{dest.name}.meta.json")
+
+    @staticmethod
+    def load(dest: Path, source: str) -> dict:
+        """
+        Returns the stored validators for `dest`, or an empty dict if there are none,
+        the sidecar is unreadable, the file is missing, or it was downloaded from a different source.
+        """
+        meta_path = HttpValidators.meta_path(dest)
+        if not dest.exists() or not meta_path.exists():
+            return {}
+        try:
+            meta = orjson.loads(meta_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        if not isinstance(meta, dict) or meta.get("source") != source:
+            return {}
+        return meta
+
+    @staticmethod
+    def conditional_headers(meta: dict) -> dict[str, str]:
+        """
+        Builds `If-None-Match` / `If-Modified-Since` request headers from stored validators.
+        """
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    @staticmethod
+    def save(dest: Path, source: str, response_headers) -> None:
+        """
+        Records the response's validators next to `dest`.
+        Removes any stale sidecar if the server sent no validators.
+        """
+        meta_path = HttpValidators.meta_path(dest)
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if not etag and not last_modified:
+            meta_path.unlink(missing_ok=True)
+            return
+        meta = {"source": source, "etag": etag, "last_modified": last_modified}
+        write_atomic(meta_path, orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+
+
+class SpecCache:
+    """
+    Content-addressed spec store shared across builds and projects.
+    Spec bodies live under `objects/<sha256[:2]>/<sha256>`; `index/<sha256(url)>.json` maps each
+    source URL to its latest body hash and HTTP validators. Files are materialized into each
+    SchemaInfo.dest by hardlink, falling back to a copy.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir: Path = Path(cache_dir)
+        self.objects_dir: Path = self.cache_dir / "objects"
+        self.index_dir: Path = self.cache_dir / "index"
+
+    @staticmethod
+    def hash_bytes(content: bytes) -> str:
+        """
+        Returns the hex sha256 digest used to address `content`.
+        """
+        return hashlib.sha256(content).hexdigest()
+
+    @staticmethod
+    def hash_file(path: Path) -> str | None:
+        """
+        Returns the `hash_bytes` digest of a file's content, read in chunks, or None if it cannot be read.
+        """
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as f:
+                while chunk := f.read(HASH_CHUNK_SIZE):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        return digest.hexdigest()
+
+    def object_path(self, digest: str) -> Path:
+        """
+        Returns the path of the stored body with the given digest.
+        """
+        return self.objects_dir / digest[:2] / digest
+
+    def index_path(self, source: str) -> Path:
+        """
+        Returns the index entry path for the given source URL.
+        """
+        return self.index_dir / f"{self.hash_bytes(source.encode('utf-8'))}.json"
+
+    def lookup(self, source: str) -> dict:
+        """
+        Returns the index entry for `source` ({source, sha256, etag, last_modified}),
+        or an empty dict if the source was never cached or its object is gone.
+        """
+        try:
+            entry = orjson.loads(self.index_path(source).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        if not isinstance(entry, dict) or entry.get("source") != source:
+            return {}
+        if not self.object_path(entry.get("sha256", "")).exists():
+            return {}
+        return entry
+
+    def store(self, source: str, content: bytes, response_headers) -> str:
+        """
+        Stores `content` (if not already present) and points the index entry for `source` at it.
+        Returns the content digest.
+        """
+        digest = self.hash_bytes(content)
+        object_path = self.object_path(digest)
+        if not object_path.exists():
+            write_atomic(object_path, content)
+        self._write_index(source, digest, response_headers)
+        return digest
+
+    def store_file(self, source: str, path: Path, digest: str, response_headers) -> None:
+        """
+        Like `store`, for a body already on disk at `path` with the given sha256 `digest`
+        (e.g. a streamed download), linking or copying it into the cache without reading it into memory.
+        """
+        object_path = self.object_path(digest)
+        if not object_path.exists():
+            link_or_copy_atomic(path, object_path)
+        self._write_index(source, digest, response_headers)
+
+    def _write_index(self, source: str, digest: str, response_headers) -> None:
+        """
+        Points the index entry for `source` at the object with the given digest.
+        """
+        entry = {
+            "source": source,
+            "sha256": digest,
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+        }
+        # Atomic, so concurrent builds sharing the cache never observe a partial object or index entry.
+        write_atomic(self.index_path(source), orjson.dumps(entry, option=orjson.OPT_INDENT_2))
+
+    def materialize(self, digest: str, dest: Path) -> None:
+        """
+        Atomically places the stored object at `dest`, replacing any existing file.
+        Uses a hardlink when possible (same filesystem), otherwise a copy.
+        """
+        link_or_copy_atomic(self.object_path(digest), dest)
@@ -0,0 +1,184 @@
+# sphinx_openapi/spec_chunker.py
+import re
+from pathlib import Path
+
+from sphinx_openapi.spec_merger import SpecMerger
+from sphinx_openapi.spec_pruner import UNPRUNABLE_CATEGORIES, ComponentPruner
+
+# Path item keys that hold operations; every other key (parameters, servers, ...) is shared by all operations.
+HTTP_METHODS = ("get", "put", "post", "delete", "options", "head", "patch", "trace")
+
+# Chunk name for operations without tags.
+UNTAGGED_CHUNK = "default"
+
+
+class SpecChunker:
+    """
+    Splits a combined spec into chunk documents (per tag, or per source spec), so a viewer can load
+    only the section a reader opens. Produces, relative to the chunk directory:
+      - one `<chunk>.<ext>` per chunk: a standalone spec with that chunk's paths, the components only
+        that chunk reaches, and every security scheme (referenced by name, so needed by each chunk)
+      - `components.<ext>`: components reached from more than one chunk (or from none); chunks refer
+        to them with external `$ref`s (`components.<ext>#/components/...`)
+      - `index.<ext>`: the 'openapi' version and 'info', and each chunk's name, file and path count
+    """
+
+    def __init__(self, spec: dict, extension: str) -> None:
+        self.spec: dict = spec
+        self.extension: str = extension
+        self.components_file: str = f"components{extension}"
+
+    @staticmethod
+    def group_by_tag(paths: dict) -> dict[str, dict]:
+        """
+        Groups operations by their tags: {tag: {path: path item with only that tag's operations}}.
+        Operations with several tags appear in each tag's chunk; untagged ones go to the "default" chunk.
+        """
+        groups: dict[str, dict] = {}
+        for path, path_item in paths.items():
+            if not isinstance(path_item, dict):
+                groups.setdefault(UNTAGGED_CHUNK, {})[path] = path_item
+                continue
+            shared = {key: value for key, value in path_item.items() if key not in HTTP_METHODS}
+            operations = {key: value for key, value in path_item.items() if key in HTTP_METHODS}
+            if not operations:
+                groups.setdefault(UNTAGGED_CHUNK, {})[path] = path_item
+                continue
+            for method, operation in operations.items():
+                tags = operation.get("tags") if isinstance(operation, dict) else None
+                for tag in tags or [UNTAGGED_CHUNK]:
+                    chunk_item = groups.setdefault(str(tag), {}).setdefault(path, dict(shared))
+                    chunk_item[method] = operation
+        return groups
+
+    @staticmethod
+    def group_by_source(paths: dict, path_sources: dict[str, str]) -> dict[str, dict]:
+        """
+        Groups paths by the source spec they were merged from: {source name: {path: path item}}.
+        """
+        groups: dict[str, dict] = {}
+        for path, path_item in paths.items():
+            groups.setdefault(path_sources.get(path, UNTAGGED_CHUNK), {})[path] = path_item
+        return groups
+
+    def build(self, groups: dict[str, dict]) -> dict[str, dict]:
+        """
+        Builds the chunk documents for the given path groups, returning {file name: document}.
+        """
+        components = self.spec.get("components", {})
+        graph = ComponentPruner(measure_sizes=False)
+        for comp_key, comp_val in components.items():
+            if isinstance(comp_val, dict):
+                for name, item_val in comp_val.items():
+                    graph.add_component(comp_key, name, item_val)
+
+        chunk_components: dict[str, set[tuple[str, str]]] = {}
+        reach_count: dict[tuple[str, str], int] = {}
+        for chunk, paths in groups.items():
+            reached = graph.reachable_from(ComponentPruner.local_refs(paths))
+            reached = {key for key in reached if key[0] not in UNPRUNABLE_CATEGORIES}
+            chunk_components[chunk] = reached
+            for key in reached:
+                reach_count[key] = reach_count.get(key, 0) + 1
+        # Anything not private to exactly one chunk is shared. Components reached from a shared component
+        # are reached from the same chunks, so the shared set is closed under references.
+        shared = {key for key in graph.components if reach_count.get(key, 0) != 1}
+        security_schemes = components.get("securitySchemes")
+
+        documents: dict[str, dict] = {}
+        index_chunks = []
+        taken = {self.components_file.lower(), f"index{self.extension}".lower()}
+        for chunk, paths in groups.items():
+            file_name = self._file_name(chunk, taken)
+            taken.add(file_name.lower())
+            document = {
+                "openapi": self.spec.get("openapi", "3.0.0"),
+                "info": self.spec.get("info", {}),
+                "paths": self._externalize_refs(paths, shared),
+            }
+            private = self._select(components, chunk_components[chunk] - shared)
+            if security_schemes:
+                private["securitySchemes"] = security_schemes
+            if private:
+                document["components"] = self._externalize_refs(private, shared)
+            documents[file_name] = document
+            index_chunks.append({"name": chunk, "file": file_name, "paths": len(paths)})
+
+        documents[self.components_file] = {
+            "openapi": self.spec.get("openapi", "3.0.0"),
+            "info": self.spec.get("info", {}),
+            "paths": {},
+            "components": self._select(components, shared),
+        }
+        documents[f"index{self.extension}"] = {
+            "openapi": self.spec.get("openapi", "3.0.0"),
+            "info": self.spec.get("info", {}),
+            "chunks": index_chunks,
+            "components": self.components_file,
+        }
+        return documents
+
+    @staticmethod
+    def _select(components: dict, keys: set[tuple[str, str]]) -> dict:
+        """
+        Returns the subset of `components` with the given (category, name) keys, in their original order.
+        """
+        selected = {}
+        for comp_key, comp_val in components.items():
+            if not isinstance(comp_val, dict):
+                continue
+            items = {name: item_val for name, item_val in comp_val.items() if (comp_key, name) in keys}
+            if items:
+                selected[comp_key] = items
+        return selected
+
+    def _externalize_refs(self, value, shared: set[tuple[str, str]]):
+        """
+        Returns a copy of `value` with local refs to shared components pointed at the components chunk.
+        The input is not modified, since the merged spec's dicts are shared across chunks.
+        """
+        if isinstance(value, dict):
+            copied = {key: self._externalize_refs(item, shared) for key, item in value.items()}
+            ref = value.get("$ref")
+            if isinstance(ref, str):
+                copied["$ref"] = self._external_ref(ref, shared)
+            discriminator = copied.get("discriminator")
+            if isinstance(discriminator, dict) and isinstance(discriminator.get("mapping"), dict):
+                discriminator["mapping"] = {
+                    key: self._external_ref(target, shared) if isinstance(target, str) else target
+                    for key, target in discriminator["mapping"].items()
+                }
+            return copied
+        if isinstance(value, list):
+            return [self._externalize_refs(item, shared) for item in value]
+        return value
+
+    def _external_ref(self, ref: str, shared: set[tuple[str, str]]) -> str:
+        """
+        Returns `ref` pointed at the components chunk if it targets a shared component, else unchanged.
+        """
+        parsed = SpecMerger._parse_local_ref(ref)
+        if not parsed or parsed[0] not in shared:
+            return ref
+        return self.components_file + SpecMerger._build_local_ref(*parsed)
+
+    def _file_name(self, chunk: str, taken: set[str]) -> str:
+        """
+        Returns a file-system safe file name for a chunk, not in `taken` (lowercased names,
+        since chunk directories may live on case-insensitive file systems).
+        """
+        slug = re.sub(r"[^A-Za-z0-9._-]+", "-", chunk).strip("-.") or "chunk"
+        file_name = f"{slug}{self.extension}"
+        counter = 1
+        while file_name.lower() in taken:
+            file_name = f"{slug}-{counter}{self.extension}"
+            counter += 1
+        return file_name
+
+    @staticmethod
+    def chunk_dir(output_path: Path) -> Path:
+        """
+        Returns the chunk directory for the given combined output path (`openapi.yaml` -> `openapi.chunks/`).
+        """
+        output_path = Path(output_path)
+        return output_path.with_name(f"{output_path.stem}.chunks")
@@ -0,0 +1,391 @@
+# sphinx_openapi/spec_merger.py
+import hashlib
+import re
+
+import orjson
+
+# Trailing `-N` suffixes, as appended to colliding names (possibly repeatedly, e.g. `Pet-1-1`).
+_SUFFIX_PATTERN = re.compile(r"(?:-\d+)+$")
+
+
+class SpecMerger:
+    """
+    Incrementally merges OpenAPI specification dictionaries into one unified spec:
+      - Uses the 'openapi' version and 'info' from the first spec.
+      - Merges all 'paths', allowing duplicate paths by appending a numeric suffix (-1, -2, etc.).
+      - Merges 'components' per category. A duplicate item key whose value is structurally identical
+        to one already merged under that key collapses into it; otherwise it is suffixed the same way.
+      - Rewrites each spec's local `$ref`s to follow its renamed paths/components, using a reverse
+        index of `$ref` locations built in one traversal per spec.
+    Suffixes come from a per-key "next suffix" counter, so resolving a collision is O(1)
+    instead of rescanning from -1 for every duplicate.
+    With keep_values=False only merged names and structural hashes are retained (values map to None),
+    for callers that write each contribution out as it is produced (see StreamingSpecWriter).
+    """
+
+    def __init__(self, keep_values: bool = True) -> None:
+        self.keep_values: bool = keep_values
+        self.openapi: str | None = None
+        self.info: dict | None = None
+        self.paths: dict = {}
+        self.components: dict[str, dict] = {}
+        # (category, merged name) -> structural hash of items whose values are not kept.
+        self._item_hashes: dict[tuple[str, str], str] = {}
+        # (section, key) -> next numeric suffix to try; section is "paths" or a component category.
+        self._next_suffix: dict[tuple[str, str], int] = {}
+        # (category, key) -> {structural hash: merged item name}, built lazily on the key's first collision.
+        self._hash_index: dict[tuple[str, str], dict[str, str]] = {}
+        self.deduplicated_count: int = 0
+        self.deduplicated_bytes: int = 0
+
+    def add_spec(self, spec: dict) -> dict:
+        """
+        Merges a single spec into the combined result and returns its contribution (see `apply_contribution`).
+        Local `$ref`s inside the spec that point at a path or component renamed by the merge
+        (e.g. `Pet` -> `Pet-1`) are rewritten in place, so the spec's dicts are modified.
+        """
+        ref_index, component_refs = self._index_refs(spec)
+        renames: dict[tuple[str, str], str] = {}
+        contribution = {
+            "openapi": spec.get("openapi", "3.0.0"),
+            "info": spec.get("info", {}),
+            "paths": [],
+            "components": [],
+            "deduplicated_count": 0,
+            "deduplicated_bytes": 0,
+        }
+
+        reserved_paths: set[str] = set()
+        for path, path_item in spec.get("paths", {}).items():
+            unique_path = self._unique_key("paths", self.paths, path, reserved_paths)
+            reserved_paths.add(unique_path)
+            if unique_path != path:
+                renames[("paths", path)] = unique_path
+            contribution["paths"].append((unique_path, path_item))
+
+        components = spec.get("components", {})
+        resolved = self._resolve_components(components, component_refs)
+        for target, (name, is_new) in resolved.items():
+            if name != target[1]:
+                renames[target] = name
+
+        self._rewrite_refs(ref_index, renames)
+
+        for (comp_key, item_key), (name, is_new) in resolved.items():
+            item_val = components[comp_key][item_key]
+            if not is_new:
+                contribution["deduplicated_count"] += 1
+                contribution["deduplicated_bytes"] += len(self.canonical_bytes(item_val))
+                contribution["components"].append((comp_key, item_key, name, None, None))
+                continue
+            item_hash = self.structural_hash(item_val) if name != item_key else None
+            contribution["components"].append((comp_key, item_key, name, item_hash, item_val))
+
+        self.apply_contribution(contribution)
+        return contribution
+
+    def apply_contribution(self, contribution: dict) -> None:
+        """
+        Splices a contribution returned by `add_spec` into the combined result without re-resolving it.
+        A contribution holds the spec's 'openapi'/'info', its paths as (merged name, item), and its components as
+        (category, original key, merged name, structural hash if suffixed, item or None if deduplicated).
+        Replaying the contributions of the same specs in the same order reproduces the original merge.
+        """
+        if self.openapi is None:
+            self.openapi = contribution["openapi"]
+            self.info = contribution["info"]
+        for name, path_item in contribution["paths"]:
+            self.paths[name] = path_item if self.keep_values else None
+        for comp_key, item_key, name, item_hash, item_val in contribution["components"]:
+            if item_val is None:
+                continue
+            merged_items = self.components.setdefault(comp_key, {})
+            if self.keep_values:
+                merged_items[name] = item_val
+            else:
+                merged_items[name] = None
+                self._item_hashes[(comp_key, name)] = item_hash or self.structural_hash(item_val)
+            if item_hash is not None:
+                self._variants(comp_key, merged_items, item_key)[item_hash] = name
+        self.deduplicated_count += contribution["deduplicated_count"]
+        self.deduplicated_bytes += contribution["deduplicated_bytes"]
+
+    def restore_item(self, section: str, item_key: str, name: str, item_hash: str | None) -> None:
+        """
+        Re-registers a single merged path or component by name and structural hash, without its value
+        (for a merger created with keep_values=False that resumes from a MergeStore).
+        """
+        if section == "paths":
+            self.paths[name] = None
+            return
+        merged_items = self.components.setdefault(section, {})
+        merged_items[name] = None
+        self._item_hashes[(section, name)] = item_hash
+        if name != item_key:
+            self._variants(section, merged_items, item_key)[item_hash] = name
+
+    @staticmethod
+    def family(name: str) -> str:
+        """
+        Returns the suffix family of a path/component name (trailing `-N` suffixes stripped).
+        Merge decisions for a name only ever depend on names of the same family.
+        """
+        return _SUFFIX_PATTERN.sub("", name)
+
+    @staticmethod
+    def contribution_families(contribution: dict) -> set[tuple[str, str]]:
+        """
+        Returns every (section, family) whose merged state the contribution's decisions depended on.
+        """
+        families = {("paths", SpecMerger.family(name)) for name, _ in contribution["paths"]}
+        for comp_key, item_key, name, _, _ in contribution["components"]:
+            families.add((comp_key, SpecMerger.family(item_key)))
+            families.add((comp_key, SpecMerger.family(name)))
+        return families
+
+    @staticmethod
+    def contribution_claims(contribution: dict | None) -> set[tuple[str, str, str | None]]:
+        """
+        Returns the (section, merged name, structural hash) entries a contribution adds to the merged state.
+        Paths carry no hash, since only their names affect later merge decisions.
+        """
+        if not contribution:
+            return set()
+        claims = {("paths", name, None) for name, _ in contribution["paths"]}
+        for comp_key, _, name, item_hash, item_val in contribution["components"]:
+            if item_val is not None:
+                claims.add((comp_key, name, item_hash or SpecMerger.structural_hash(item_val)))
+        return claims
+
+    def _resolve_components(
+        self, components: dict, component_refs: dict[tuple[str, str], set]
+    ) -> dict[tuple[str, str], tuple[str, bool]]:
+        """
+        Decides the merged name of every component in an incoming spec.
+        Returns {(category, key): (merged name, is_new)} in spec order, where is_new is False for a component
+        that collapses into a structurally identical variant already merged under the same key.
+        Identity is judged after applying the spec's own renames to its `$ref`s, iterated to a fixed
+        point: a component referencing a renamed component can no longer equal the original.
+        """
+        resolved: dict[tuple[str, str], tuple[str, bool]] = {}
+        colliding: list[tuple[str, str]] = []
+        for comp_key, comp_val in components.items():
+            merged_items = self.components.get(comp_key, {})
+            for item_key in comp_val:
+                colliding_item = item_key in merged_items
+                if colliding_item:
+                    colliding.append((comp_key, item_key))
+                resolved[(comp_key, item_key)] = (item_key, not colliding_item)
+
+        # target -> tentative merged name; a distinct component gets a placeholder no merged variant can match.
+        tentative: dict[tuple[str, str], str] = {}
+        distinct: set[tuple[str, str]] = set()
+        for _ in range(len(colliding) + 1):
+            changed = False
+            for target in colliding:
+                if target in distinct:
+                    continue
+                comp_key, item_key = target
+                value = components[comp_key][item_key]
+                if any(tentative.get(dep, dep[1]) != dep[1] for dep in component_refs.get(target, ())):
+                    value = self._substitute_refs(value, tentative)
+                variants = self._variants(comp_key, self.components[comp_key], item_key)
+                match = variants.get(self.structural_hash(value))
+                if match is None and target in component_refs.get(target, ()):
+                    match = self._match_self_referencing(components[comp_key][item_key], target, tentative, variants)
+                if match is None:
+                    distinct.add(target)
+                    tentative[target] = f"\0{item_key}"
+                    changed = True
+                elif tentative.get(target, item_key) != match:
+                    tentative[target] = match
+                    changed = True
+            if not changed:
+                break
+        else:
+            # No fixed point within the bound (pathological reference cycles): suffixing is always safe.
+            distinct.update(colliding)
+
+        # Reserve every name this spec claims before allocating suffixes, so a suffix can't land on a
+        # name the spec also defines literally (e.g. `Pet` colliding while the spec also has `Pet-1`).
+        reserved: dict[str, set[str]] = {}
+        for (comp_key, item_key), (name, is_new) in resolved.items():
+            if is_new:
+                reserved.setdefault(comp_key, set()).add(name)
+        for target in colliding:
+            comp_key, item_key = target
+            if target in distinct:
+                category_reserved = reserved.setdefault(comp_key, set())
+                unique_key = self._unique_key(comp_key, self.components[comp_key], item_key, category_reserved)
+                category_reserved.add(unique_key)
+                resolved[target] = (unique_key, True)
+            else:
+                resolved[target] = (tentative.get(target, item_key), False)
+        return resolved
+
+    def merged_spec(self) -> dict:
+        """
+        Returns the combined spec built from every spec added so far.
+        """
+        merged_spec = {
+            "openapi": self.openapi or "3.0.0",
+            "info": self.info or {},
+            "paths": self.paths,
+        }
+        if self.components:
+            merged_spec["components"] = self.components
+        return merged_spec
+
+    @staticmethod
+    def canonical_bytes(value) -> bytes:
+        """
+        Returns a canonical JSON encoding of a component (sorted keys), so structurally identical
+        values encode to identical bytes regardless of key order.
+        """
+        return orjson.dumps(value, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+
+    @staticmethod
+    def structural_hash(value) -> str:
+        """
+        Returns the sha256 of a component's canonical encoding.
+        """
+        return hashlib.sha256(SpecMerger.canonical_bytes(value)).hexdigest()
+
+    def _variants(self, category: str, merged_items: dict, key: str) -> dict[str, str]:
+        """
+        Returns the {structural hash: merged name} index of every variant merged under `key`,
+        seeding it with the original (unsuffixed) entry the first time `key` collides.
+        """
+        variants = self._hash_index.get((category, key))
+        if variants is None:
+            item_hash = self._item_hashes.get((category, key)) or self.structural_hash(merged_items[key])
+            variants = {item_hash: key}
+            self._hash_index[(category, key)] = variants
+        return variants
+
+    def _match_self_referencing(
+        self, value, target: tuple[str, str], tentative: dict[tuple[str, str], str], variants: dict[str, str]
+    ) -> str | None:
+        """
+        Matches a component that references itself (e.g. a tree `Node`) against each merged variant,
+        assuming its self-references point at that variant, since a renamed variant refers to its own new name.
+        """
+        for name in variants.values():
+            substituted = self._substitute_refs(value, {**tentative, target: name})
+            if variants.get(self.structural_hash(substituted)) == name:
+                return name
+        return None
+
+    @staticmethod
+    def _index_refs(spec: dict) -> tuple[dict[str, list[dict]], dict[tuple[str, str], set]]:
+        """
+        Walks the spec's paths and components once, returning:
+          - a reverse index {`$ref` string: [every dict holding that `$ref`]}, used to rewrite refs in place
+          - {(category, key): {(section, name) targets of local refs inside that component}}
+        """
+        ref_index: dict[str, list[dict]] = {}
+        component_refs: dict[tuple[str, str], set] = {}
+
+        def walk(node, deps: set | None) -> None:
+            stack = [node]
+            seen: set[int] = set()
+            while stack:
+                current = stack.pop()
+                if isinstance(current, dict):
+                    if id(current) in seen:
+                        continue
+                    seen.add(id(current))
+                    ref = current.get("$ref")
+                    if isinstance(ref, str):
+                        ref_index.setdefault(ref, []).append(current)
+                        parsed = SpecMerger._parse_local_ref(ref)
+                        if deps is not None and parsed:
+                            deps.add(parsed[0])
+                    stack.extend(current.values())
+                elif isinstance(current, list):
+                    stack.extend(current)
+
+        walk(spec.get("paths", {}), None)
+        for comp_key, comp_val in spec.get("components", {}).items():
+            for item_key, item_val in comp_val.items():
+                deps = component_refs[(comp_key, item_key)] = set()
+                walk(item_val, deps)
+        return ref_index, component_refs
+
+    @staticmethod
+    def _parse_local_ref(ref: str) -> tuple[tuple[str, str], str] | None:
+        """
+        Parses `#/components/<category>/<name>[/...]` or `#/paths/<path>[/...]` into
+        ((section, unescaped name), remainder). Returns None for external or other refs.
+        """
+        if ref.startswith("#/components/"):
+            parts = ref[len("#/components/"):].split("/", 2)
+            if len(parts) < 2:
+                return None
+            section, name, rest = parts[0], parts[1], parts[2] if len(parts) > 2 else ""
+        elif ref.startswith("#/paths/"):
+            parts = ref[len("#/paths/"):].split("/", 1)
+            section, name, rest = "paths", parts[0], parts[1] if len(parts) > 1 else ""
+        else:
+            return None
+        return (section, name.replace("~1", "/").replace("~0", "~")), rest
+
+    @staticmethod
+    def _build_local_ref(target: tuple[str, str], rest: str) -> str:
+        """
+        Inverse of `_parse_local_ref`: builds a JSON-pointer `$ref` for the (section, name) target.
+        """
+        section, name = target
+        escaped = name.replace("~", "~0").replace("/", "~1")
+        prefix = "#/paths/" if section == "paths" else f"#/components/{section}/"
+        return f"{prefix}{escaped}/{rest}" if rest else f"{prefix}{escaped}"
+
+    @staticmethod
+    def _rewrite_refs(ref_index: dict[str, list[dict]], renames: dict[tuple[str, str], str]) -> None:
+        """
+        Points every indexed `$ref` whose target was renamed at the target's merged name.
+        """
+        if not renames:
+            return
+        for ref, holders in ref_index.items():
+            parsed = SpecMerger._parse_local_ref(ref)
+            if not parsed or parsed[0] not in renames:
+                continue
+            target, rest = parsed
+            new_ref = SpecMerger._build_local_ref((target[0], renames[target]), rest)
+            for holder in holders:
+                holder["$ref"] = new_ref
+
+    @staticmethod
+    def _substitute_refs(value, renames: dict[tuple[str, str], str]):
+        """
+        Returns a copy of `value` with local `$ref`s rewritten per `renames`, for identity comparison.
+        """
+        if isinstance(value, dict):
+            copy = {key: SpecMerger._substitute_refs(item, renames) for key, item in value.items()}
+            ref = copy.get("$ref")
+            if isinstance(ref, str):
+                parsed = SpecMerger._parse_local_ref(ref)
+                if parsed and parsed[0] in renames:
+                    target, rest = parsed
+                    copy["$ref"] = SpecMerger._build_local_ref((target[0], renames[target]), rest)
+            return copy
+        if isinstance(value, list):
+            return [SpecMerger._substitute_refs(item, renames) for item in value]
+        return value
+
+    def _unique_key(self, section: str, existing: dict, key: str, reserved: set[str] = frozenset()) -> str:
+        """
+        Returns `key` if it is free in `existing` (and not `reserved`), otherwise the next free `key-N`.
+        The counter only rescans past names that inputs literally use (e.g. a spec defining `Error-1`),
+        so allocation is amortized O(1) per collision.
+        """
+        if key not in existing and key not in reserved:
+            return key
+        counter = self._next_suffix.get((section, key), 1)
+        unique_key = f"{key}-{counter}"
+        while unique_key in existing or unique_key in reserved:
+            counter += 1
+            unique_key = f"{key}-{counter}"
+        self._next_suffix[(section, key)] = counter + 1
+        return unique_key
@@ -0,0 +1,135 @@
+# sphinx_openapi/spec_pruner.py
+from sphinx_openapi.spec_merger import SpecMerger
+
+# Categories referenced by name rather than `$ref` (security requirements), so never pruned.
+UNPRUNABLE_CATEGORIES = {"securitySchemes"}
+
+
+class ComponentPruner:
+    """
+    Finds the components of a spec that are reachable from its paths via local `$ref`s
+    (including discriminator mappings), so unreferenced ones can be dropped from the combined spec.
+    Each component's outgoing refs are collected once as it is added; reachability is a
+    breadth-first walk over those edges with a visited set, so reference cycles terminate.
+    Values can be fed one at a time, so it also works while streaming.
+    """
+
+    def __init__(self, measure_sizes: bool = True) -> None:
+        self.measure_sizes: bool = measure_sizes
+        self.roots: set[tuple[str, str]] = set()
+        # (category, name) -> (local ref targets inside the component, canonical size in bytes or 0)
+        self.components: dict[tuple[str, str], tuple[set[tuple[str, str]], int]] = {}
+
+    def add_path(self, path_item) -> None:
+        """
+        Marks every component referenced by a path item as reachable.
+        """
+        self.roots |= self.local_refs(path_item)
+
+    def add_component(self, comp_key: str, name: str, item_val) -> None:
+        """
+        Records a component's outgoing refs and size.
+        """
+        self.components[(comp_key, name)] = (
+            self.local_refs(item_val),
+            len(SpecMerger.canonical_bytes(item_val)) if self.measure_sizes else 0,
+        )
+
+    def add_contribution(self, contribution: dict) -> None:
+        """
+        Adds every path and new component of a SpecMerger contribution.
+        """
+        for _, path_item in contribution["paths"]:
+            self.add_path(path_item)
+        for comp_key, _, name, _, item_val in contribution["components"]:
+            if item_val is not None:
+                self.add_component(comp_key, name, item_val)
+
+    def reachable(self) -> set[tuple[str, str]]:
+        """
+        Returns every (category, name) component to keep: those reachable from the paths,
+        plus all components of categories that are not referenced via `$ref`.
+        """
+        keep = {key for key in self.components if key[0] in UNPRUNABLE_CATEGORIES}
+        return keep | self.reachable_from(self.roots)
+
+    def reachable_from(self, roots: set[tuple[str, str]]) -> set[tuple[str, str]]:
+        """
+        Returns the known components in `roots` plus every component they reach via local refs.
+        """
+        queue = [key for key in roots if key in self.components]
+        reached = set(queue)
+        while queue:
+            key = queue.pop()
+            for target in self.components[key][0]:
+                if target not in reached and target in self.components:
+                    reached.add(target)
+                    queue.append(target)
+        return reached
+
+    def unreachable_summary(self, keep: set[tuple[str, str]]) -> tuple[int, int]:
+        """
+        Returns the (count, canonical bytes) of the components not in `keep`.
+        """
+        removed = [size for key, (_, size) in self.components.items() if key not in keep]
+        return len(removed), sum(removed)
+
+    @classmethod
+    def prune(cls, spec: dict) -> tuple[dict, int, int]:
+        """
+        Returns a copy of `spec` without unreachable components (the spec itself is not modified),
+        along with the number of components removed and their canonical size in bytes.
+        """
+        pruner = cls()
+        for path_item in spec.get("paths", {}).values():
+            pruner.add_path(path_item)
+        for key, value in spec.items():
+            if key not in ("paths", "components"):
+                pruner.add_path(value)  # e.g. webhooks
+        components = spec.get("components", {})
+        for comp_key, comp_val in components.items():
+            if isinstance(comp_val, dict):
+                for name, item_val in comp_val.items():
+                    pruner.add_component(comp_key, name, item_val)
+
+        keep = pruner.reachable()
+        removed_count, removed_bytes = pruner.unreachable_summary(keep)
+        if not removed_count:
+            return spec, 0, 0
+        pruned_components = {}
+        for comp_key, comp_val in components.items():
+            if not isinstance(comp_val, dict):
+                pruned_components[comp_key] = comp_val
+                continue
+            kept = {name: item_val for name, item_val in comp_val.items() if (comp_key, name) in keep}
+            if kept:
+                pruned_components[comp_key] = kept
+        pruned_spec = {key: value for key, value in spec.items() if key != "components"}
+        if pruned_components:
+            pruned_spec["components"] = pruned_components
+        return pruned_spec, removed_count, removed_bytes
+
+    @staticmethod
+    def local_refs(value) -> set[tuple[str, str]]:
+        """
+        Returns the (category, name) targets of all local component refs inside `value`:
+        `$ref`s and discriminator mapping values.
+        """
+        targets: set[tuple[str, str]] = set()
+        stack = [value]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, dict):
+                ref = current.get("$ref")
+                refs = [ref] if isinstance(ref, str) else []
+                discriminator = current.get("discriminator")
+                if isinstance(discriminator, dict) and isinstance(discriminator.get("mapping"), dict):
+                    refs.extend(ref for ref in discriminator["mapping"].values() if isinstance(ref, str))
+                for ref in refs:
+                    parsed = SpecMerger._parse_local_ref(ref)
+                    if parsed and parsed[0][0] != "paths":
+                        targets.add(parsed[0])
+                stack.extend(current.values())
+            elif isinstance(current, list):
+                stack.extend(current)
+        return targets
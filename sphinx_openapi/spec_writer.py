@@ -0,0 +1,221 @@
+# sphinx_openapi/spec_writer.py
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import BinaryIO
+
+import orjson
+
+from sphinx_openapi.atomic_io import replacement_mode
+from sphinx_openapi.serialization import dump_minified_json, dump_yaml
+from sphinx_openapi.spec_cache import SpecCache
+
+
+class StreamingSpecWriter:
+    """
+    Writes a combined spec incrementally from SpecMerger contributions, so only one source spec
+    needs to be in memory at a time. Paths are appended to a temp file next to the output as they
+    arrive; components are spooled per category to temp files and appended on `commit`, which then
+    replaces the output only if its content changed.
+    Produces YAML, or JSON (2-space indented, byte-identical to `dump_spec`) if the output path ends in `.json`,
+    or single-line JSON (matching `dump_minified_json`) with minified=True.
+    YAML output keeps paths and components in merge order rather than sorting them.
+    """
+
+    def __init__(self, output_path: Path, minified: bool = False) -> None:
+        self.output_path: Path = Path(output_path)
+        self.minified: bool = minified
+        self.is_json: bool = minified or self.output_path.suffix.lower() == ".json"
+        self.path_count: int = 0
+        self._spools: dict[str, BinaryIO] = {}
+        # Category -> (name, offset, length) of every spooled component entry, in write order.
+        self._spooled: dict[str, list[tuple[str, int, int]]] = {}
+        self._header_written: bool = False
+        self._digest = hashlib.sha256()
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_name = tempfile.mkstemp(
+            dir=self.output_path.parent, prefix=f".{self.output_path.name}.", suffix=".tmp"
+        )
+        self._out: BinaryIO = os.fdopen(fd, "wb")
+
+    def write_contribution(self, contribution: dict) -> None:
+        """
+        Appends a contribution's paths to the output and spools its new components.
+        The first contribution also provides the 'openapi' version and 'info'.
+        """
+        if not self._header_written:
+            self.write_header(contribution["openapi"], contribution["info"])
+        for name, path_item in contribution["paths"]:
+            self.write_path(name, path_item)
+        for comp_key, _, name, _, item_val in contribution["components"]:
+            if item_val is not None:
+                self.write_component(comp_key, name, item_val)
+
+    def write_header(self, openapi: str, info: dict) -> None:
+        """
+        Writes the 'openapi' version and 'info'; must precede any path.
+        """
+        if self.is_json:
+            self._write(
+                self._layout(b'{\n  "openapi": ') + orjson.dumps(openapi)
+                + self._layout(b',\n  "info": ') + self._json_value(info, depth=1)
+                + self._layout(b',\n  "paths": {')
+            )
+        else:
+            self._write(dump_yaml({"openapi": openapi}) + dump_yaml({"info": info}) + b"paths:\n")
+        self._header_written = True
+
+    def write_path(self, name: str, path_item) -> None:
+        """
+        Appends one merged path to the output.
+        """
+        if self.is_json:
+            self._write(self._layout(b",\n" if self.path_count else b"\n"))
+        self._write(self._entry(name, path_item, depth=1))
+        self.path_count += 1
+
+    def write_component(self, comp_key: str, name: str, item_val) -> None:
+        """
+        Spools one merged component under its category.
+        """
+        spool = self._spools.get(comp_key)
+        if spool is None:
+            spool = self._spools[comp_key] = tempfile.TemporaryFile(dir=self.output_path.parent)
+            self._spooled[comp_key] = []
+        entry = self._entry(name, item_val, depth=2)
+        self._spooled[comp_key].append((name, spool.tell(), len(entry)))
+        spool.write(entry)
+
+    def commit(self, keep_components: set[tuple[str, str]] | None = None) -> bool:
+        """
+        Finishes the document and moves it into place. If `keep_components` is given, only the
+        (category, name) components in it are written (see ComponentPruner).
+        Returns True if the output was written, False if it already held identical content.
+        """
+        try:
+            if not self._header_written:
+                self.write_header("3.0.0", {})
+            self._write_components(keep_components)
+            self._out.close()
+            if self._digest.hexdigest() == SpecCache.hash_file(self.output_path):
+                Path(self._tmp_name).unlink(missing_ok=True)
+                return False
+            os.chmod(self._tmp_name, replacement_mode(self.output_path))
+            os.replace(self._tmp_name, self.output_path)
+            return True
+        except BaseException:
+            self.discard()
+            raise
+
+    def discard(self) -> None:
+        """
+        Abandons the document, removing the temp file and spools.
+        """
+        self._out.close()
+        for spool in self._spools.values():
+            spool.close()
+        Path(self._tmp_name).unlink(missing_ok=True)
+
+    def _write_components(self, keep_components: set[tuple[str, str]] | None) -> None:
+        """
+        Writes the 'components' section from the spool, leaving out entries not in `keep_components`
+        (when given) and categories left empty.
+        """
+        categories = {}
+        for comp_key, entries in self._spooled.items():
+            if keep_components is not None:
+                entries = [entry for entry in entries if (comp_key, entry[0]) in keep_components]
+            if entries:
+                categories[comp_key] = entries
+
+        if self.is_json:
+            layout = self._layout
+            self._write(layout(b"\n  }" if self.path_count else b"}"))
+            if categories:
+                self._write(layout(b',\n  "components": {'))
+                for index, (comp_key, entries) in enumerate(categories.items()):
+                    prefix = layout(b"\n    " if index == 0 else b",\n    ")
+                    self._write(prefix + orjson.dumps(comp_key) + layout(b": {"))
+                    self._copy_entries(self._spools[comp_key], entries, separator=layout(b",\n"), first=layout(b"\n"))
+                    self._write(layout(b"\n    }"))
+                self._write(layout(b"\n  }"))
+            self._write(layout(b"\n}"))
+            return
+
+        if not self.path_count:
+            # Replace the bare 'paths:' key with an explicit empty mapping.
+            self._write(b"  {}\n")
+        if categories:
+            self._write(b"components:\n")
+            for comp_key, entries in categories.items():
+                self._write(self._indent(dump_yaml({comp_key: None}).replace(b" null", b""), depth=1))
+                self._copy_entries(self._spools[comp_key], entries)
+
+    def _entry(self, name: str, value, depth: int) -> bytes:
+        """
+        Serializes one `name: value` mapping entry, indented to sit `depth` levels deep
+        (without the separator JSON needs between entries).
+        """
+        if self.is_json:
+            pad = self._layout(b"  " * (depth + 1))
+            return pad + orjson.dumps(name) + self._layout(b": ") + self._json_value(value, depth + 1)
+        return self._indent(dump_yaml({name: value}), depth)
+
+    def _json_value(self, value, depth: int) -> bytes:
+        """
+        Serializes a JSON value indented for nesting `depth` levels deep
+        (JSON strings cannot contain raw newlines, so re-indenting line starts is safe).
+        """
+        if self.minified:
+            return dump_minified_json(value)
+        dumped = orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        return dumped.replace(b"\n", b"\n" + b"  " * depth)
+
+    def _layout(self, literal: bytes) -> bytes:
+        """
+        Returns a structural JSON literal (braces, separators, indentation, fixed keys),
+        stripped of all whitespace when writing minified JSON.
+        """
+        if self.minified:
+            return literal.replace(b"\n", b"").replace(b" ", b"")
+        return literal
+
+    @staticmethod
+    def _indent(yaml_bytes: bytes, depth: int) -> bytes:
+        """
+        Indents every line of a YAML document by `depth` levels (2 spaces each).
+        Relative indentation, including block scalars, is preserved.
+        """
+        pad = b"  " * depth
+        return b"".join(pad + line if line.strip() else line for line in yaml_bytes.splitlines(keepends=True))
+
+    def _copy_entries(
+        self, spool: BinaryIO, entries: list[tuple[str, int, int]], separator: bytes = b"", first: bytes = b""
+    ) -> None:
+        """
+        Copies the given spooled entries to the output, reading runs of adjacent entries in one go.
+        """
+        runs: list[list[int]] = []
+        for _, offset, length in entries:
+            if runs and runs[-1][1] == offset and not separator:
+                runs[-1][1] += length
+            else:
+                runs.append([offset, offset + length])
+        for index, (start, end) in enumerate(runs):
+            self._write(first if index == 0 else separator)
+            spool.seek(start)
+            while start < end:
+                chunk = spool.read(min(1024 * 1024, end - start))
+                if not chunk:
+                    break
+                self._write(chunk)
+                start += len(chunk)
+        spool.close()
+
+    def _write(self, data: bytes) -> None:
+        """
+        Writes `data` to the temp output file and feeds it to the running output digest.
+        """
+        self._out.write(data)
+        self._digest.update(data)
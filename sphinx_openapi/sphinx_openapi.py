@@ -1,12 +1,57 @@
 # sphinx_openapi/sphinx_openapi.py
+import glob
+import hashlib
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 import requests
 import yaml
-from requests.exceptions import Timeout
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ChunkedEncodingError, Timeout
 from sphinx.application import Sphinx
+from sphinx.errors import SphinxError
 
+from sphinx_openapi.atomic_io import commit_temp, create_temp, replacement_mode, write_atomic
+from sphinx_openapi.circuit_breaker import CircuitBreaker
+from sphinx_openapi.merge_state import MergeState
+from sphinx_openapi.merge_store import MergeStore
+from sphinx_openapi.models.retry_policy import RetryPolicy
 from sphinx_openapi.models.schema_info import SchemaInfo
+from sphinx_openapi.precompress import Precompressor
+from sphinx_openapi.serialization import dump_minified_json, dump_spec, load_spec, minified_json_path
+from sphinx_openapi.spec_cache import HttpValidators, SpecCache
+from sphinx_openapi.spec_chunker import SpecChunker
+from sphinx_openapi.spec_merger import SpecMerger
+from sphinx_openapi.spec_pruner import ComponentPruner
+from sphinx_openapi.spec_writer import StreamingSpecWriter
+
+# Per-thread log buffer; set while a worker processes a schema so its output can be replayed in order.
+_log_state = threading.local()
+
+# Read size for streamed downloads.
+_CHUNK_SIZE = 256 * 1024
+
+# Download errors that may succeed on retry (HTTP errors only for the policy's retry statuses).
+_RETRYABLE_ERRORS = (Timeout, requests.exceptions.ConnectionError, ChunkedEncodingError, requests.exceptions.HTTPError)
+
+
+class SpecTooLargeError(Exception):
+    """
+    Raised when a spec exceeds `openapi_max_spec_bytes`.
+    """
+
+
+class OfflineCacheMissError(SphinxError):
+    """
+    Raised in `openapi_offline` mode when URL sources have no cached copy to build from.
+    A SphinxError, so Sphinx reports it as a plain build error rather than an extension crash.
+    """
+
+    category = "sphinx_openapi offline build failed"
 
 
 class SphinxOpenApi:
@@ -21,14 +66,79 @@ class SphinxOpenApi:
         self.openapi_use_xbe_workarounds: bool = app.config.openapi_use_xbe_workarounds
         self.openapi_stop_build_on_error: bool = app.config.openapi_stop_build_on_error
         self.openapi_debug_stop_on_done: bool = app.config.openapi_debug_stop_on_done
+        self.openapi_max_workers: int = app.config.openapi_max_workers
+        self.openapi_http_pool_size: int = app.config.openapi_http_pool_size
+        self.openapi_http_keep_alive: bool = app.config.openapi_http_keep_alive
+        self.openapi_http_revalidate: bool = app.config.openapi_http_revalidate
         self.combined_schema_file_path: Path = (
             app.config.openapi_combined_schema_file_path
         )
+        self.openapi_incremental_merge: bool = app.config.openapi_incremental_merge
+        self.openapi_streaming_merge: bool = app.config.openapi_streaming_merge
+        self.openapi_merge_store_threshold: int | None = app.config.openapi_merge_store_threshold
+        self.openapi_prune_unused_components: bool = app.config.openapi_prune_unused_components
+        self.openapi_minified_json: bool = app.config.openapi_minified_json
+        self.openapi_precompress: bool = app.config.openapi_precompress
+        self.openapi_chunked_output: str | None = app.config.openapi_chunked_output
+        self.openapi_max_spec_bytes: int | None = app.config.openapi_max_spec_bytes
+        self.retry_policy: RetryPolicy = RetryPolicy(
+            max_attempts=app.config.openapi_retry_attempts,
+            backoff=app.config.openapi_retry_backoff,
+            max_delay=app.config.openapi_retry_max_delay,
+        )
+        self.openapi_circuit_breaker_threshold: int | None = app.config.openapi_circuit_breaker_threshold
+        self.openapi_offline: bool = app.config.openapi_offline
+        self.openapi_stale_while_revalidate: bool = app.config.openapi_stale_while_revalidate
+        self.openapi_revalidate_timeout: float = app.config.openapi_revalidate_timeout
+        self.openapi_prefetch: bool = app.config.openapi_prefetch
+        self.spec_cache: SpecCache | None = (
+            SpecCache(app.config.openapi_cache_dir) if app.config.openapi_cache_dir else None
+        )
+        self.session: requests.Session | None = None
+        self.circuit_breaker: CircuitBreaker | None = None
+        # Stale-while-revalidate: URL sources served from their cached copy this build, and the refresh thread.
+        self.stale_sources: set[str] = set()
+        self.revalidation_thread: threading.Thread | None = None
+        # Downloads started at `config-inited` (`openapi_prefetch`), joined at `env-before-read-docs`.
+        self.prefetch_future: Future | None = None
+        self.prefetch_log: list[str] = []
+
+    def prefetch_openapi(self, app: Sphinx, config) -> None:
+        """
+        `config-inited` handler: with `openapi_prefetch`, starts downloading and processing the specs on a
+        background thread, so spec I/O overlaps Sphinx's environment loading and builder/theme setup.
+        Its log is buffered and replayed when the results are joined in `finish_openapi`.
+        """
+        if not self.openapi_prefetch or not self.schema_info_list:
+            return
+        self.log(f"Prefetching {len(self.schema_info_list)} spec(s) in the background")
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sphinx_openapi_prefetch")
+        self.prefetch_future = executor.submit(self._fetch_schemas_buffered)
+        executor.shutdown(wait=False)
 
     def setup_openapi(self, app: Sphinx) -> None:
         """
         Downloads each OpenAPI schema, applies workarounds if enabled,
         and combines them into a single unified YAML file.
+        When the downloads were prefetched, this `builder-inited` call is a no-op and
+        `finish_openapi` completes the setup instead.
+        """
+        if self.prefetch_future is not None:
+            return
+        self._run_setup()
+
+    def finish_openapi(self, app: Sphinx, env, docnames: list[str]) -> None:
+        """
+        `env-before-read-docs` handler: waits for the prefetched downloads (the first point where
+        documents may read the spec files), then combines and writes the remaining outputs.
+        """
+        future, self.prefetch_future = self.prefetch_future, None
+        if future is not None:
+            self._run_setup(future)
+
+    def _run_setup(self, prefetched: Future | None = None) -> None:
+        """
+        Runs the whole setup, fetching the specs now or joining the prefetch that already fetched them.
         """
         if not self.schema_info_list:
             self.log("No OpenAPI specs configured, skipping setup")
@@ -40,14 +150,33 @@ class SphinxOpenApi:
         for schema in self.schema_info_list:
             self.log(f"- {schema.source}")
 
-        for schema in self.schema_info_list:
-            self.download_file(schema.source, schema.dest)
-            if self.openapi_use_xbe_workarounds:
-                self._apply_xbe_workarounds(schema)
+        if prefetched is not None:
+            try:
+                prefetched.result()
+            finally:
+                for line in self.prefetch_log:
+                    print(line)
+                self.prefetch_log = []
+        else:
+            self._fetch_schemas()
 
         if self.combined_schema_file_path:
             self._combine_schemas()
 
+        if self.openapi_precompress:
+            self._precompress_outputs()
+
+        # Outputs are written; drop the in-memory copies so they don't live for the rest of the build.
+        for schema in self.schema_info_list:
+            schema.release()
+
+        if self.circuit_breaker:
+            self._report_circuit_breaker()
+            self.circuit_breaker = None
+
+        if self.stale_sources:
+            self._start_revalidation()
+
         print("")
         self.log("Finished setup.")
         
@@ -56,58 +185,586 @@ class SphinxOpenApi:
             import sys
             sys.exit(0)
 
+    def _fetch_schemas(self) -> None:
+        """
+        Downloads and post-processes every schema over a fresh pooled session.
+        """
+        self._remove_orphaned_temp_files()
+        if self.openapi_offline:
+            self._check_offline_sources()
+        elif self.openapi_stale_while_revalidate:
+            self.stale_sources = {
+                str(schema.source)
+                for schema in self.schema_info_list
+                if self._is_url(str(schema.source)) and self._cached_copy_path(schema) is not None
+            }
+
+        self.session = self._create_session()
+        if self.openapi_circuit_breaker_threshold:
+            self.circuit_breaker = CircuitBreaker(self.openapi_circuit_breaker_threshold)
+        try:
+            self._process_schemas()
+        finally:
+            self.session.close()
+            self.session = None
+
+    def _fetch_schemas_buffered(self) -> None:
+        """
+        Runs `_fetch_schemas` on the prefetch thread, collecting its log lines into `prefetch_log`.
+        """
+        _log_state.buffer = []
+        try:
+            self._fetch_schemas()
+        finally:
+            self.prefetch_log, _log_state.buffer = _log_state.buffer, None
+
+    def _create_session(self) -> requests.Session:
+        """
+        Creates the per-build HTTP session shared by all downloads.
+        Connections are pooled per host, so specs served from the same gateway reuse a single handshake.
+        """
+        pool_size = max(1, self.openapi_http_pool_size, self.openapi_max_workers or 1)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        if not self.openapi_http_keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def _process_schemas(self) -> None:
+        """
+        Downloads and post-processes every schema, using up to `openapi_max_workers` threads.
+        Each worker buffers its log output, which is replayed in `schema_info_list` order.
+        """
+        max_workers = max(1, min(self.openapi_max_workers or 1, len(self.schema_info_list)))
+        if max_workers == 1:
+            for schema in self.schema_info_list:
+                self._process_schema(schema)
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sphinx_openapi") as executor:
+                for lines in executor.map(self._process_schema_buffered, self.schema_info_list):
+                    for line in lines:
+                        self.emit(line)
+
+        updated = sum(1 for schema in self.schema_info_list if schema.changed)
+        unchanged = sum(1 for schema in self.schema_info_list if schema.changed is False)
+        self.emit("")
+        self.log(f"Spec files: {updated} updated, {unchanged} unchanged")
+
+    def _process_schema(self, schema: SchemaInfo) -> None:
+        """
+        Runs a single schema through the in-memory pipeline:
+        fetch bytes -> parse + transform once (only if workarounds are enabled) -> serialize once -> save.
+        """
+        schema.changed = None
+        try:
+            if not self._fetch_schema(schema):
+                return
+            if self.openapi_use_xbe_workarounds:
+                self._apply_xbe_workarounds(schema)
+            schema.changed = self._save_schema(schema)
+        finally:
+            self._discard_download(schema)
+        if self.openapi_minified_json and schema.changed is not None:
+            self._write_minified_twin(schema)
+        if self.openapi_streaming_merge or self._use_merge_store():
+            # The combine step re-reads each spec from dest, one at a time.
+            schema.release()
+
+    def _process_schema_buffered(self, schema: SchemaInfo) -> list[str]:
+        """
+        Runs `_process_schema` on a worker thread, returning its log lines instead of printing them.
+        """
+        _log_state.buffer = []
+        try:
+            self._process_schema(schema)
+        except Exception as e:
+            self.log(f"Unexpected error processing '{schema.source}': {str(e)}", is_error=True)
+        finally:
+            lines, _log_state.buffer = _log_state.buffer, None
+        return lines
+
     @staticmethod
-    def download_file(source: str | Path, save_to_path: Path, timeout: int = 5) -> None:
+    def download_file(
+        source: str | Path, save_to_path: Path, timeout: int = 5, session: requests.Session | None = None
+    ) -> bool | None:
         """
         Downloads a file from the given URL or copies from local path to the provided path.
-        Overwrites any existing file.
+        Standalone helper using default settings (no spec cache, revalidation, retries or size cap);
+        pass `session` to reuse pooled connections across calls. URL bodies are streamed to a temp file,
+        and the file is only (atomically) rewritten if its content changed.
+        Returns True if the file was written, False if it was unchanged, or None on failure.
         """
+        schema = SchemaInfo(str(source), save_to_path)
+        source_str = schema.source
+        is_url = SphinxOpenApi._is_url(source_str)
         try:
-            source_str = str(source)
-            if source_str.startswith(('http://', 'https://')):
-                response = requests.get(source_str, timeout=timeout)
-                response.raise_for_status()
-                content = response.content
+            if is_url:
+                with (session or requests).get(source_str, timeout=timeout, stream=True) as response:
+                    response.raise_for_status()
+                    SphinxOpenApi._download_to_temp(schema, response)
+                changed = schema.content_sha256 != SpecCache.hash_file(save_to_path)
+                if changed:
+                    commit_temp(schema.download_path, save_to_path)
+                    schema.download_path = None
             else:
-                # Handle local file
                 with open(source_str, 'rb') as f:
                     content = f.read()
-            
-            save_to_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(save_to_path, "wb") as f:
-                f.write(content)
-            print("")
-            print(
-                f"[sphinx_openapi] Successfully {'downloaded' if source_str.startswith(('http://', 'https://')) else 'copied'} '{source_str}' to: '{save_to_path}'"
-            )
+                changed = not SphinxOpenApi._is_unchanged(save_to_path, content)
+                if changed:
+                    SphinxOpenApi._write_dest(save_to_path, content)
         except Timeout:
             print(f"[sphinx_openapi] Timeout occurred while downloading: '{source_str}'")
+            return None
         except requests.exceptions.HTTPError as http_err:
             print(f"[sphinx_openapi] HTTP error for '{source_str}': {http_err}")
+            return None
         except requests.exceptions.RequestException as req_err:
             print(f"[sphinx_openapi] Error downloading '{source_str}': {req_err}")
+            return None
         except FileNotFoundError:
             print(f"[sphinx_openapi] File not found: '{source_str}'")
+            return None
         except Exception as e:
             print(f"[sphinx_openapi] Unexpected error processing '{source_str}': {e}")
+            return None
+        finally:
+            SphinxOpenApi._discard_download(schema)
+
+        print("")
+        if changed:
+            print(f"[sphinx_openapi] Successfully {'downloaded' if is_url else 'copied'} '{source_str}' to: '{save_to_path}'")
+        else:
+            print(f"[sphinx_openapi] Unchanged: '{source_str}' (kept '{save_to_path}')")
+        return changed
+
+    def _fetch_schema(self, schema: SchemaInfo, timeout: int = 5) -> bool:
+        """
+        Loads the raw bytes of `schema.source`: fresh HTTP bodies are streamed to `schema.download_path`
+        (hashed on the fly), anything else is read into `schema.content`. Sources larger than
+        `openapi_max_spec_bytes` are rejected, aborting a download as soon as the limit is crossed.
+        Transient URL failures are retried per `schema.retry` (or the global `openapi_retry_*` policy).
+        Sources on a host whose circuit breaker is open are not requested; their cached copy is used instead.
+        Returns False (after logging why) if the source could not be fetched.
+        """
+        source_str = str(schema.source)
+        try:
+            if self._is_url(source_str):
+                if self.openapi_offline:
+                    return self._use_cached_copy(schema, "offline")
+                if source_str in self.stale_sources and threading.current_thread() is not self.revalidation_thread:
+                    return self._use_cached_copy(schema, "stale-while-revalidate")
+                if self.circuit_breaker and not self.circuit_breaker.allow(source_str):
+                    host = CircuitBreaker.host(source_str)
+                    return self._use_cached_copy(schema, f"circuit open for host '{host}'")
+                self._fetch_url_with_retries(schema, timeout)
+            else:
+                # Handle local file
+                self._check_size(os.path.getsize(source_str), self.openapi_max_spec_bytes)
+                with open(source_str, 'rb') as f:
+                    schema.content = f.read()
+            return True
+        except SpecTooLargeError as e:
+            self.emit(f"[sphinx_openapi] Spec too large, skipped '{source_str}': {e}")
+        except Timeout:
+            self.emit(f"[sphinx_openapi] Timeout occurred while downloading: '{source_str}'")
+        except requests.exceptions.HTTPError as http_err:
+            self.emit(f"[sphinx_openapi] HTTP error for '{source_str}': {http_err}")
+        except requests.exceptions.RequestException as req_err:
+            self.emit(f"[sphinx_openapi] Error downloading '{source_str}': {req_err}")
+        except FileNotFoundError:
+            self.emit(f"[sphinx_openapi] File not found: '{source_str}'")
+        except Exception as e:
+            self.emit(f"[sphinx_openapi] Unexpected error processing '{source_str}': {e}")
+        return False
+
+    def _fetch_url_with_retries(self, schema: SchemaInfo, timeout: int) -> None:
+        """
+        Runs `_fetch_url`, sleeping and retrying after timeouts, dropped connections and retryable
+        statuses until the retry policy gives up (or the host's circuit opens); the last error is then re-raised.
+        The outcome is reported to the circuit breaker once per source: a failure only if the retries
+        were used up on host-level errors (timeouts, connection errors), since any HTTP response means
+        the host is up.
+        """
+        source_str = str(schema.source)
+        breaker = self.circuit_breaker
+        policy = schema.retry or self.retry_policy
+        attempt = 1
+        while True:
+            try:
+                self._fetch_url(schema, timeout)
+                if breaker:
+                    breaker.record_success(source_str)
+                return
+            except _RETRYABLE_ERRORS as e:
+                response = e.response if isinstance(e, requests.exceptions.HTTPError) else None
+                retryable = response is None or response.status_code in policy.retry_statuses
+                retry_after = response.headers.get("Retry-After") if response is not None else None
+                delay = policy.delay(attempt, retry_after) if retryable else None
+                if delay is None or (breaker and breaker.is_open(source_str)):
+                    if breaker:
+                        self._record_host_outcome(source_str, e)
+                    raise
+                reason = f"HTTP {response.status_code}" if response is not None else type(e).__name__
+                attempt += 1
+                self.emit(
+                    f"[sphinx_openapi] {reason} for '{schema.source}', retrying in {delay:.1f}s "
+                    f"(attempt {attempt}/{policy.max_attempts})"
+                )
+                time.sleep(delay)
+
+    def _record_host_outcome(self, source: str, error: Exception) -> None:
+        """
+        Reports a source's final download error to the circuit breaker: timeouts and connection
+        errors count against its host, anything the host answered resets the host's count.
+        """
+        if not isinstance(error, (Timeout, requests.exceptions.ConnectionError)):
+            self.circuit_breaker.record_success(source)
+        elif self.circuit_breaker.record_failure(source):
+            self.emit(
+                f"[sphinx_openapi] Circuit breaker opened for host '{CircuitBreaker.host(source)}' "
+                f"after {self.circuit_breaker.threshold} consecutive failed source(s)"
+            )
+
+    def _fetch_url(self, schema: SchemaInfo, timeout: int) -> None:
+        """
+        Performs one (conditional) GET of `schema.source`, streaming a fresh body to a temp file.
+        """
+        source_str = str(schema.source)
+        save_to_path = schema.dest
+        http = self.session or requests
+        validators = self._load_validators(source_str, save_to_path) if self.openapi_http_revalidate else {}
+        with http.get(
+            source_str,
+            timeout=timeout,
+            headers=HttpValidators.conditional_headers(validators),
+            stream=True,
+        ) as response:
+            schema.not_modified = response.status_code == 304
+            if schema.not_modified:
+                if self.spec_cache:
+                    schema.content = self.spec_cache.object_path(validators["sha256"]).read_bytes()
+                else:
+                    schema.content = save_to_path.read_bytes()
+            else:
+                response.raise_for_status()
+                self._download_to_temp(schema, response, self.openapi_max_spec_bytes)
+                schema.response_headers = response.headers
+                if self.spec_cache:
+                    self.spec_cache.store_file(
+                        source_str, schema.download_path, schema.content_sha256, response.headers
+                    )
+
+    def _use_cached_copy(self, schema: SchemaInfo, reason: str) -> bool:
+        """
+        Loads the last known copy of a URL source without a request: its spec cache object if cached,
+        else the existing dest file. Returns False (after logging why) if there is no copy.
+        """
+        source_str = str(schema.source)
+        copy_path = self._cached_copy_path(schema)
+        if copy_path is None:
+            self.emit(f"[sphinx_openapi] Skipped '{source_str}' ({reason}), and no cached copy exists")
+            return False
+        schema.content = copy_path.read_bytes()
+        schema.from_cache = True
+        return True
+
+    def _cached_copy_path(self, schema: SchemaInfo) -> Path | None:
+        """
+        Returns the file holding the last known copy of a URL source (spec cache object, else dest), or None.
+        """
+        entry = self.spec_cache.lookup(str(schema.source)) if self.spec_cache else {}
+        if entry:
+            return self.spec_cache.object_path(entry["sha256"])
+        if schema.dest.is_file():
+            return schema.dest
+        return None
+
+    def _check_offline_sources(self) -> None:
+        """
+        Fails fast in offline mode: raises OfflineCacheMissError (after listing them) if any
+        URL source has no cached copy, before anything is written.
+        """
+        missing = [
+            str(schema.source)
+            for schema in self.schema_info_list
+            if self._is_url(str(schema.source)) and self._cached_copy_path(schema) is None
+        ]
+        if not missing:
+            return
+        self.log(f"Offline mode: {len(missing)} URL source(s) have no cached copy:", is_error=True)
+        for source in missing:
+            self.log(f"- {source}")
+        raise OfflineCacheMissError(
+            f"no cached copy of {len(missing)} URL source(s): {', '.join(missing)}"
+        )
+
+    def _start_revalidation(self) -> None:
+        """
+        Stale-while-revalidate: refetches the sources served from their cached copy this build on a
+        background thread, through the normal pipeline (conditional request, workarounds, compare-before-write),
+        so a `dest` file is only rewritten - and e.g. sphinx-autobuild only triggered - if upstream changed.
+        The combined schema picks up the refreshed specs on the next build. The rest of the build runs
+        alongside the refresh; `join_revalidation` waits for it at `build-finished`, for at most
+        `openapi_revalidate_timeout` seconds. A refresh still running then is abandoned when the process
+        exits (daemon thread): dest files are only ever replaced atomically, so they stay intact, and the
+        partial download it leaves behind is removed before the next build fetches.
+        """
+        schemas = [
+            SchemaInfo(schema.source, schema.dest, schema.retry)
+            for schema in self.schema_info_list
+            if str(schema.source) in self.stale_sources
+        ]
+        self.stale_sources = set()
+        if self.revalidation_thread and self.revalidation_thread.is_alive():
+            self.log("Background revalidation from a previous build still running, not starting another")
+            return
+        self.log(f"Serving {len(schemas)} cached spec(s); revalidating in the background")
+        self.revalidation_thread = threading.Thread(
+            target=self._revalidate, args=(schemas,), name="sphinx_openapi_revalidate", daemon=True
+        )
+        self.revalidation_thread.start()
+
+    def join_revalidation(self, app: Sphinx, exception: Exception | None) -> None:
+        """
+        `build-finished` handler: waits up to `openapi_revalidate_timeout` seconds for the background
+        revalidation, and reports it as abandoned if it is still running after that.
+        """
+        thread = self.revalidation_thread
+        if thread is None or not thread.is_alive():
+            return
+        thread.join(self.openapi_revalidate_timeout)
+        if thread.is_alive():
+            self.log(
+                f"Background revalidation still running after {self.openapi_revalidate_timeout}s; "
+                "abandoned at exit, cached specs will be revalidated again next build",
+                is_error=True,
+            )
+
+    def _remove_orphaned_temp_files(self) -> None:
+        """
+        Removes temp files next to each dest (`.<name>.*.download`, `.tmp`, `.link`) left by a process
+        that exited mid-write, e.g. while a background revalidation was still downloading.
+        Skipped while this process's own revalidation thread may still be writing them.
+        """
+        if self.revalidation_thread and self.revalidation_thread.is_alive():
+            return
+        for dest in {Path(schema.dest) for schema in self.schema_info_list}:
+            prefix = glob.escape(f".{dest.name}.")
+            for suffix in (".download", ".tmp", ".link"):
+                for orphan in dest.parent.glob(f"{prefix}*{suffix}"):
+                    orphan.unlink(missing_ok=True)
+
+    def _revalidate(self, schemas: list[SchemaInfo]) -> None:
+        """
+        Background thread body for `_start_revalidation`. Only the logs of specs that changed
+        upstream (or failed) are printed, followed by a one-line summary. With `openapi_precompress`,
+        the compressed siblings of rewritten specs are refreshed too.
+        """
+        updated: list[Path] = []
+        unchanged = 0
+        for schema in schemas:
+            lines = self._process_schema_buffered(schema)
+            if schema.changed is False:
+                unchanged += 1
+                continue
+            if schema.changed:
+                updated.append(schema.dest)
+            for line in lines:
+                print(line)
+        if self.openapi_precompress and updated:
+            outputs = updated + ([minified_json_path(path) for path in updated] if self.openapi_minified_json else [])
+            _, _, failed = Precompressor(self.openapi_max_workers).run(outputs)
+            for path, error in failed:
+                self.log(f"Failed to precompress '{path}': {str(error)}", is_error=True)
+        self.log(f"Background revalidation finished: {len(updated)} updated, {unchanged} unchanged")
+
+    def _report_circuit_breaker(self) -> None:
+        """
+        Logs every host whose circuit opened during this build, and the sources skipped because of it.
+        """
+        for host, failures, skipped in self.circuit_breaker.report():
+            self.log(
+                f"Circuit breaker open for host '{host}' ({failures} consecutive failure(s)); "
+                f"{len(skipped)} source(s) skipped",
+                is_error=True,
+            )
+            for source in skipped:
+                self.log(f"- {source}")
+
+    def _save_schema(self, schema: SchemaInfo) -> bool | None:
+        """
+        Writes `schema.content` (or moves a streamed download) to `schema.dest` unless the file already
+        holds identical bytes. Untransformed URL bodies are hardlinked from the spec cache when it is enabled.
+        Returns True if the file was written, False if it was unchanged, or None on failure.
+        """
+        source_str = str(schema.source)
+        save_to_path = schema.dest
+        is_url = self._is_url(source_str)
+        try:
+            if schema.content is None and schema.download_path is not None:
+                # Untransformed streamed download: compare by hash, then move (or link from the cache) into place.
+                changed = schema.content_sha256 != SpecCache.hash_file(save_to_path)
+                if changed:
+                    if self.spec_cache:
+                        self.spec_cache.materialize(schema.content_sha256, save_to_path)
+                    else:
+                        commit_temp(schema.download_path, save_to_path)
+                        schema.download_path = None
+            else:
+                changed = not self._is_unchanged(save_to_path, schema.content)
+            if schema.content is not None and changed:
+                if self.spec_cache and is_url and schema.spec is None:
+                    self.spec_cache.materialize(SpecCache.hash_bytes(schema.content), save_to_path)
+                else:
+                    self._write_dest(save_to_path, schema.content)
+            if schema.response_headers is not None and self.openapi_http_revalidate and not self.spec_cache:
+                HttpValidators.save(save_to_path, source_str, schema.response_headers)
+        except Exception as e:
+            self.emit(f"[sphinx_openapi] Unexpected error saving '{source_str}' to '{save_to_path}': {e}")
+            return None
+
+        self.emit("")
+        if schema.from_cache:
+            self.emit(
+                f"[sphinx_openapi] Using cached copy of '{source_str}' "
+                f"({'restored to' if changed else 'kept'}: '{save_to_path}')"
+            )
+        elif schema.not_modified:
+            if changed:
+                self.emit(f"[sphinx_openapi] Not modified: '{source_str}' (restored to: '{save_to_path}')")
+            else:
+                self.emit(f"[sphinx_openapi] Not modified since last build: '{source_str}'")
+        elif changed:
+            self.emit(
+                f"[sphinx_openapi] Successfully {'downloaded' if is_url else 'copied'} '{source_str}' to: '{save_to_path}'"
+            )
+        else:
+            self.emit(f"[sphinx_openapi] Unchanged: '{source_str}' (kept '{save_to_path}')")
+        return changed
+
+    @staticmethod
+    def _is_url(source: str) -> bool:
+        """
+        Returns True if the source is an http(s) URL rather than a local file path.
+        """
+        return source.startswith(('http://', 'https://'))
+
+    @staticmethod
+    def _parse_schema(schema: SchemaInfo) -> dict:
+        """
+        Returns the parsed spec, parsing `schema.content` on first use only (JSON via orjson, else YAML).
+        Reads a streamed download, or the existing dest file if the source was not fetched this build.
+        """
+        if schema.spec is None:
+            if schema.content is None:
+                schema.content = (schema.download_path or schema.dest).read_bytes()
+            content_type = schema.response_headers.get("Content-Type") if schema.response_headers else None
+            schema.spec = load_spec(schema.content, content_type)
+        return schema.spec
+
+    @staticmethod
+    def _download_to_temp(schema: SchemaInfo, response: requests.Response, max_bytes: int | None = None) -> None:
+        """
+        Streams a response body in chunks to a temp file next to `schema.dest`, hashing it on the fly,
+        and records it in `schema.download_path` / `schema.content_sha256`.
+        Raises SpecTooLargeError (removing the partial file) once the body exceeds `max_bytes`.
+        """
+        content_length = response.headers.get("Content-Length")
+        if content_length and content_length.isdigit():
+            SphinxOpenApi._check_size(int(content_length), max_bytes)
+        digest = hashlib.sha256()
+        size = 0
+        f, tmp_path = create_temp(schema.dest, suffix=".download")
+        try:
+            with f:
+                for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+                    size += len(chunk)
+                    SphinxOpenApi._check_size(size, max_bytes)
+                    digest.update(chunk)
+                    f.write(chunk)
+            # mkstemp files are private; the download may be hardlinked into the shared cache and dest as is.
+            os.chmod(tmp_path, replacement_mode(schema.dest))
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        schema.download_path = tmp_path
+        schema.content_sha256 = digest.hexdigest()
+
+    @staticmethod
+    def _check_size(size: int, max_bytes: int | None) -> None:
+        """
+        Raises SpecTooLargeError if `size` bytes exceeds `max_bytes` (`openapi_max_spec_bytes`).
+        """
+        if max_bytes is not None and size > max_bytes:
+            raise SpecTooLargeError(f"more than openapi_max_spec_bytes ({max_bytes:,} bytes)")
+
+    @staticmethod
+    def _discard_download(schema: SchemaInfo) -> None:
+        """
+        Removes a streamed download's temp file that was not moved into place.
+        """
+        if schema.download_path is not None:
+            schema.download_path.unlink(missing_ok=True)
+            schema.download_path = None
+
+    def _load_validators(self, source: str, save_to_path: Path) -> dict:
+        """
+        Returns the HTTP validators of the last download of `source`,
+        from the shared spec cache when enabled, otherwise from the sidecar next to `save_to_path`.
+        """
+        if self.spec_cache:
+            return self.spec_cache.lookup(source)
+        return HttpValidators.load(save_to_path, source)
+
+    @staticmethod
+    def _is_unchanged(path: Path, content: bytes) -> bool:
+        """
+        Returns True if `path` already holds exactly `content` (size check, then sha256 comparison).
+        """
+        try:
+            if path.stat().st_size != len(content):
+                return False
+            return SpecCache.hash_bytes(path.read_bytes()) == SpecCache.hash_bytes(content)
+        except OSError:
+            return False
+
+    @staticmethod
+    def _write_dest(path: Path, content: bytes) -> None:
+        """
+        Writes `content` to `path` atomically (temp file + `os.replace`), so a docs server reading
+        the file never sees it truncated. Replacing rather than truncating also never writes through
+        a hardlink into the shared spec cache.
+        """
+        write_atomic(path, content)
+
+    def _write_if_changed(self, path: Path, content: bytes) -> bool:
+        """
+        Writes `content` to `path` unless the file already holds identical bytes,
+        leaving its mtime untouched so incremental builds and syncs skip it.
+        Returns True if the file was written.
+        """
+        if self._is_unchanged(path, content):
+            return False
+        self._write_dest(path, content)
+        return True
 
     def _apply_xbe_workarounds(self, schema: SchemaInfo) -> None:
         """
-        Applies XBE workarounds by injecting a logo into the schema.
+        Applies XBE workarounds by injecting a logo into the parsed schema,
+        then re-serializes it into `schema.content`. Leaves the schema untouched if it cannot be parsed.
         """
         try:
-            with open(schema.dest, "r", encoding="utf-8") as f:
-                spec = yaml.safe_load(f)
+            spec = self._parse_schema(schema)
             if isinstance(spec, dict) and "info" in spec:
                 spec["info"][
                     "x-logo"
                 ] = "../../../_static/images/xbe_static_docs/logo.png"
-            with open(schema.dest, "w", encoding="utf-8") as f:
-                yaml.safe_dump(spec, f)
+            schema.content = dump_spec(spec, schema.dest)
             self.log(f"Applied XBE workarounds to '{schema.dest}'")
-        except FileNotFoundError:
-            self.log(f"Schema file not found: '{schema.dest}'", is_error=True)
         except yaml.YAMLError as e:
+            schema.spec = None
             self.log(f"Invalid YAML in '{schema.dest}': {str(e)}", is_error=True)
         except Exception as e:
             self.log(f"Failed to apply XBE workarounds to '{schema.dest}': {str(e)}", is_error=True)
@@ -115,86 +772,449 @@ class SphinxOpenApi:
     def _combine_schemas(self) -> None:
         """
         Combines all downloaded OpenAPI YAML schemas into one unified spec.
-        Merges the 'paths' and 'components' sections.
+        Merges the 'paths' and 'components' sections, reusing each schema's already-parsed spec.
+        With `openapi_incremental_merge`, per-spec content hashes and merge contributions are persisted:
+        the combine step is skipped when no input changed, and otherwise only changed specs (plus any
+        whose merged names they affect) are re-parsed and re-merged.
         """
-        specs = []
-        for schema in self.schema_info_list:
-            try:
-                with open(schema.dest, "r", encoding="utf-8") as f:
-                    spec = yaml.safe_load(f)
-                    specs.append(spec)
-            except FileNotFoundError:
-                self.log(f"Schema file not found: '{schema.dest}'", is_error=True)
-                continue
-            except yaml.YAMLError as e:
-                self.log(f"Invalid YAML in '{schema.dest}': {str(e)}", is_error=True)
-                continue
-            except Exception as e:
-                self.log(f"Error reading '{schema.dest}': {str(e)}", is_error=True)
+        if self._use_merge_store() or self.openapi_streaming_merge:
+            if self.openapi_chunked_output:
+                self.log("openapi_chunked_output needs the in-memory combine; no chunks written", is_error=True)
+                self._remove_chunk_dir()
+            if self._use_merge_store():
+                self._combine_schemas_stored()
+            else:
+                self._combine_schemas_streaming()
+            return
+
+        output_path = self.combined_schema_file_path
+        sources = [str(schema.source) for schema in self.schema_info_list]
+        digests = [self._schema_digest(schema) for schema in self.schema_info_list]
+
+        previous = MergeState.load(output_path) if self.openapi_incremental_merge else None
+        if previous and previous.sources() != sources:
+            previous = None
+        if (
+            previous
+            and [entry["digest"] for entry in previous.entries] == digests
+            and previous.output_sha256 is not None
+            and previous.options == self._combine_options()
+            and self._extra_outputs_ready(output_path)
+            and SpecCache.hash_file(output_path) == previous.output_sha256
+        ):
+            print("")
+            self.log(f"Combined schema up to date (no input changes), skipped combine: '{output_path}'")
+            return
+
+        merger = SpecMerger()
+        entries = []
+        affected: set[tuple[str, str]] = set()  # (section, family) whose merged state differs from last build
+        remerged = reused = 0
+        for index, (schema, digest) in enumerate(zip(self.schema_info_list, digests)):
+            old = previous.entries[index] if previous else None
+            old_contribution = old["contribution"] if old else None
+            if (
+                old_contribution is not None
+                and digest is not None
+                and old["digest"] == digest
+                and not (SpecMerger.contribution_families(old_contribution) & affected)
+            ):
+                merger.apply_contribution(old_contribution)
+                entries.append(old)
+                reused += 1
                 continue
 
-        if not specs:
+            contribution = self._merge_schema(merger, schema) if digest is not None else None
+            remerged += contribution is not None
+            if previous:
+                changed_claims = SpecMerger.contribution_claims(old_contribution) ^ SpecMerger.contribution_claims(
+                    contribution
+                )
+                affected.update((section, SpecMerger.family(name)) for section, name, _ in changed_claims)
+            entries.append({"source": str(schema.source), "digest": digest, "contribution": contribution})
+
+        if merger.openapi is None:
+            self.log("No valid schemas to combine", is_error=True)
+            return
+
+        try:
+            merged_spec = merger.merged_spec()
+            pruned = (0, 0)
+            if self.openapi_prune_unused_components:
+                merged_spec, *pruned = ComponentPruner.prune(merged_spec)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            content = dump_spec(merged_spec, output_path)
+            print("")
+            if previous:
+                self.log(f"Incremental merge: re-merged {remerged} spec(s), reused {reused} unchanged spec(s)")
+            self._log_combine_stats(merger, *pruned)
+            if self._write_if_changed(output_path, content):
+                self.log(f"Combined schemas written to '{output_path}'")
+            else:
+                self.log(f"Combined schema unchanged: '{output_path}'")
+            if self.openapi_minified_json:
+                twin_path = minified_json_path(output_path)
+                if self._write_if_changed(twin_path, dump_minified_json(merged_spec)):
+                    self.log(f"Minified JSON written to '{twin_path}'")
+            if self.openapi_chunked_output:
+                self._write_chunks(merged_spec, entries)
+            if self.openapi_incremental_merge:
+                MergeState(output_path, entries, SpecCache.hash_bytes(content), self._combine_options()).save()
+        except Exception as e:
+            self.log(f"Error writing combined schema file: {str(e)}", is_error=True)
+
+    def _combine_schemas_streaming(self) -> None:
+        """
+        Combines all schemas like `_combine_schemas`, but writes each spec's contribution to the output
+        as soon as it is merged and releases the spec, so at most one parsed spec is held in memory.
+        The merger only keeps merged names and structural hashes (see StreamingSpecWriter).
+        """
+        output_path = self.combined_schema_file_path
+        merger = SpecMerger(keep_values=False)
+        pruner = ComponentPruner() if self.openapi_prune_unused_components else None
+        try:
+            writers = self._open_writers(output_path)
+        except Exception as e:
+            self.log(f"Error writing combined schema file: {str(e)}", is_error=True)
+            return
+
+        try:
+            for schema in self.schema_info_list:
+                contribution = self._merge_schema(merger, schema)
+                schema.release()
+                if contribution is not None:
+                    for writer in writers:
+                        writer.write_contribution(contribution)
+                    if pruner:
+                        pruner.add_contribution(contribution)
+        except Exception as e:
+            for writer in writers:
+                writer.discard()
+            self.log(f"Error writing combined schema file: {str(e)}", is_error=True)
+            return
+
+        if merger.openapi is None:
+            for writer in writers:
+                writer.discard()
             self.log("No valid schemas to combine", is_error=True)
             return
 
         try:
-            merged_spec = self.merge_openapi_specs(specs)
-            self.combined_schema_file_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.combined_schema_file_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(merged_spec, f)
+            keep = pruner.reachable() if pruner else None
+            print("")
+            self._log_combine_stats(merger, *(pruner.unreachable_summary(keep) if pruner else (0, 0)))
+            self._commit_writers(writers, keep, "streamed")
+        except Exception as e:
+            self.log(f"Error writing combined schema file: {str(e)}", is_error=True)
+
+    def _open_writers(self, output_path: Path) -> list[StreamingSpecWriter]:
+        """
+        Opens a StreamingSpecWriter for the combined output, plus one for its minified JSON twin if enabled.
+        """
+        writers = [StreamingSpecWriter(output_path)]
+        if self.openapi_minified_json:
+            try:
+                writers.append(StreamingSpecWriter(minified_json_path(output_path), minified=True))
+            except BaseException:
+                writers[0].discard()
+                raise
+        return writers
+
+    def _commit_writers(
+        self, writers: list[StreamingSpecWriter], keep: set[tuple[str, str]] | None, mode: str
+    ) -> None:
+        """
+        Commits the writers opened by `_open_writers` and logs which outputs changed.
+        """
+        try:
+            written = writers[0].commit(keep)
+        except BaseException:
+            for writer in writers[1:]:
+                writer.discard()
+            raise
+        if written:
+            self.log(f"Combined schemas written to '{writers[0].output_path}' ({mode})")
+        else:
+            self.log(f"Combined schema unchanged: '{writers[0].output_path}'")
+        for writer in writers[1:]:
+            if writer.commit(keep):
+                self.log(f"Minified JSON written to '{writer.output_path}'")
+
+    def _use_merge_store(self) -> bool:
+        """
+        Returns True if the spec set is large enough to combine through the on-disk MergeStore.
+        """
+        threshold = self.openapi_merge_store_threshold
+        return threshold is not None and len(self.schema_info_list) > threshold
+
+    def _combine_schemas_stored(self) -> None:
+        """
+        Combines all schemas through a MergeStore (SQLite) instead of in-memory dicts.
+        Merged paths and components go to disk spec by spec, and only their names and structural hashes
+        stay in memory. The store survives the build: specs already merged from an unchanged prefix of
+        `schema_info_list` (same sources, same content) are restored instead of re-merged, which also
+        resumes an interrupted combine. The output is then streamed from the store.
+        """
+        output_path = self.combined_schema_file_path
+        merger = SpecMerger(keep_values=False)
+        try:
+            store = MergeStore(output_path)
+        except Exception as e:
+            self.log(f"Error opening merge store: {str(e)}", is_error=True)
+            return
+
+        try:
+            merged_sources = store.merged_sources()
+            position = 0
+            for schema, (source, digest) in zip(self.schema_info_list, merged_sources):
+                if digest is None or source != str(schema.source) or self._schema_digest(schema) != digest:
+                    break
+                schema.release()
+                position += 1
+            if position < len(merged_sources):
+                store.truncate(position)
+            store.restore(merger)
+            reused = position
+
+            for index in range(position, len(self.schema_info_list)):
+                schema = self.schema_info_list[index]
+                digest = self._schema_digest(schema)
+                contribution = self._merge_schema(merger, schema) if digest is not None else None
+                schema.release()
+                store.add(index, str(schema.source), digest, contribution)
+
+            header = store.header()
+            if header is None:
+                self.log("No valid schemas to combine", is_error=True)
+                return
+
             print("")
-            self.log(f"Combined schemas written to '{self.combined_schema_file_path}'")
+            self.log(
+                f"Merge store: merged {len(self.schema_info_list) - reused} spec(s), "
+                f"restored {reused} unchanged spec(s) from '{store.path}'"
+            )
+            if (
+                reused == len(self.schema_info_list)
+                and store.get_meta("options") == self._combine_options()
+                and store.get_meta("output_sha256") == SpecCache.hash_file(output_path)
+                and self._extra_outputs_ready(output_path)
+            ):
+                self._log_combine_stats(merger)
+                self.log(f"Combined schema unchanged: '{output_path}'")
+                return
+
+            pruner = ComponentPruner() if self.openapi_prune_unused_components else None
+            writers = self._open_writers(output_path)
+            try:
+                for writer in writers:
+                    writer.write_header(*header)
+                for section, name, value in store.items():
+                    if section == "paths":
+                        for writer in writers:
+                            writer.write_path(name, value)
+                        if pruner:
+                            pruner.add_path(value)
+                    else:
+                        for writer in writers:
+                            writer.write_component(section, name, value)
+                        if pruner:
+                            pruner.add_component(section, name, value)
+                keep = pruner.reachable() if pruner else None
+            except BaseException:
+                for writer in writers:
+                    writer.discard()
+                raise
+            self._log_combine_stats(merger, *(pruner.unreachable_summary(keep) if pruner else (0, 0)))
+            self._commit_writers(writers, keep, "from merge store")
+            store.set_meta("output_sha256", SpecCache.hash_file(output_path))
+            store.set_meta("options", self._combine_options())
         except Exception as e:
             self.log(f"Error writing combined schema file: {str(e)}", is_error=True)
+        finally:
+            store.close()
+
+    def _precompress_outputs(self) -> None:
+        """
+        Writes .gz (and .br, if brotli is installed) siblings of every spec file, the combined schema,
+        and their minified JSON twins. Files whose content is unchanged since the last build are skipped.
+        """
+        outputs = [schema.dest for schema in self.schema_info_list]
+        if self.combined_schema_file_path:
+            outputs.append(self.combined_schema_file_path)
+        if self.openapi_minified_json:
+            outputs += [minified_json_path(path) for path in outputs]
+        if self.combined_schema_file_path and self._chunks_enabled():
+            output_path = self.combined_schema_file_path
+            outputs += sorted(SpecChunker.chunk_dir(output_path).glob(f"*{output_path.suffix or '.yaml'}"))
+
+        precompressor = Precompressor(self.openapi_max_workers)
+        compressed, skipped, failed = precompressor.run(outputs)
+        print("")
+        for path, error in failed:
+            self.log(f"Failed to precompress '{path}': {str(error)}", is_error=True)
+        encodings = ", ".join(suffix.lstrip(".") for suffix in precompressor.encodings)
+        self.log(f"Precompressed ({encodings}): {compressed} file(s) compressed, {skipped} unchanged")
+
+    def _extra_outputs_ready(self, output_path: Path) -> bool:
+        """
+        Returns False if an enabled extra output of the combine step (minified JSON twin, chunk index)
+        is missing, so an up-to-date combine still writes it.
+        """
+        if self.openapi_minified_json and not minified_json_path(output_path).exists():
+            return False
+        if self._chunks_enabled():
+            index_path = SpecChunker.chunk_dir(output_path) / f"index{output_path.suffix or '.yaml'}"
+            if not index_path.exists():
+                return False
+        return True
+
+    def _chunks_enabled(self) -> bool:
+        """
+        Returns True if chunked output is requested and can be written (only by the in-memory combine).
+        """
+        return bool(self.openapi_chunked_output) and not (self.openapi_streaming_merge or self._use_merge_store())
+
+    def _remove_chunk_dir(self) -> None:
+        """
+        Removes a chunk directory left by a previous build (chunks, precompressed siblings and manifest),
+        so outdated chunks are not served once they can no longer be kept up to date.
+        """
+        chunk_dir = SpecChunker.chunk_dir(self.combined_schema_file_path)
+        if chunk_dir.is_dir():
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+            self.log(f"Removed stale chunked output: '{chunk_dir}'")
+
+    def _write_chunks(self, merged_spec: dict, entries: list[dict]) -> None:
+        """
+        Splits the combined spec into per-tag or per-source chunk files plus an index document and a
+        shared components chunk (see SpecChunker), in a `<combined name>.chunks` directory.
+        Chunk files left over from a previous build are removed.
+        """
+        output_path = self.combined_schema_file_path
+        mode = self.openapi_chunked_output
+        paths = merged_spec.get("paths", {})
+        if mode == "tag":
+            groups = SpecChunker.group_by_tag(paths)
+        elif mode == "source":
+            path_sources = {}
+            for schema, entry in zip(self.schema_info_list, entries):
+                if entry["contribution"]:
+                    for name, _ in entry["contribution"]["paths"]:
+                        path_sources[name] = Path(schema.dest).stem
+            groups = SpecChunker.group_by_source(paths, path_sources)
+        else:
+            self.log(f"Unknown openapi_chunked_output '{mode}' (expected 'tag' or 'source')", is_error=True)
+            return
+
+        extension = output_path.suffix or ".yaml"
+        chunk_dir = SpecChunker.chunk_dir(output_path)
+        try:
+            documents = SpecChunker(merged_spec, extension).build(groups)
+            chunk_dir.mkdir(parents=True, exist_ok=True)
+            written = 0
+            for file_name, document in documents.items():
+                chunk_path = chunk_dir / file_name
+                written += self._write_if_changed(chunk_path, dump_spec(document, chunk_path))
+            for stale in chunk_dir.glob(f"*{extension}"):
+                if stale.name not in documents:
+                    for path in (stale, *(stale.with_name(stale.name + suffix) for suffix in (".gz", ".br"))):
+                        path.unlink(missing_ok=True)
+            self.log(
+                f"Chunked output ({mode}): {len(groups)} chunk(s) in '{chunk_dir}', {written} file(s) updated"
+            )
+        except Exception as e:
+            self.log(f"Error writing chunked output: {str(e)}", is_error=True)
+
+    def _write_minified_twin(self, schema: SchemaInfo) -> None:
+        """
+        Writes the minified JSON twin of `schema.dest` (`<name>.min.json`) next to it.
+        Skipped if dest was unchanged and the twin already exists, so unchanged specs are not re-parsed.
+        """
+        twin_path = minified_json_path(schema.dest)
+        if schema.changed is False and twin_path.exists():
+            return
+        try:
+            spec = self._parse_schema(schema)
+            if self._write_if_changed(twin_path, dump_minified_json(spec)):
+                self.log(f"Minified JSON written to '{twin_path}'")
+        except Exception as e:
+            self.log(f"Failed to write minified JSON for '{schema.dest}': {str(e)}", is_error=True)
+
+    def _combine_options(self) -> dict:
+        """
+        Returns the settings that change the combined output beyond its inputs, recorded alongside
+        saved merge state so that changing them forces the combined file to be rewritten.
+        """
+        return {
+            "prune_unused_components": self.openapi_prune_unused_components,
+            "chunked_output": self.openapi_chunked_output,
+        }
+
+    def _log_combine_stats(self, merger: SpecMerger, pruned_count: int = 0, pruned_bytes: int = 0) -> None:
+        """
+        Logs how many components the combine step deduplicated and pruned.
+        """
+        if merger.deduplicated_count:
+            self.log(
+                f"Deduplicated {merger.deduplicated_count} identical component(s), "
+                f"saving ~{merger.deduplicated_bytes:,} bytes"
+            )
+        if pruned_count:
+            self.log(f"Pruned {pruned_count} unreferenced component(s), saving ~{pruned_bytes:,} bytes")
+
+    def _merge_schema(self, merger: SpecMerger, schema: SchemaInfo) -> dict | None:
+        """
+        Parses (if not already parsed) and merges a single schema, returning its merge contribution,
+        or None (after logging why) if it is not a valid spec.
+        """
+        try:
+            spec = self._parse_schema(schema)
+            if not isinstance(spec, dict):
+                self.log(f"Not an OpenAPI spec (expected a mapping): '{schema.dest}'", is_error=True)
+                return None
+            return merger.add_spec(spec)
+        except FileNotFoundError:
+            self.log(f"Schema file not found: '{schema.dest}'", is_error=True)
+        except yaml.YAMLError as e:
+            self.log(f"Invalid YAML in '{schema.dest}': {str(e)}", is_error=True)
+        except Exception as e:
+            self.log(f"Error merging '{schema.dest}': {str(e)}", is_error=True)
+        return None
+
+    def _schema_digest(self, schema: SchemaInfo) -> str | None:
+        """
+        Returns the sha256 of the schema's final bytes, loading them from dest if this build
+        did not fetch them. Returns None (after logging why) if the schema cannot be read.
+        """
+        try:
+            if schema.content is None and schema.content_sha256 is not None:
+                return schema.content_sha256  # Untransformed streamed download, now in dest
+            if schema.content is None:
+                schema.content = schema.dest.read_bytes()
+            return SpecCache.hash_bytes(schema.content)
+        except FileNotFoundError:
+            self.log(f"Schema file not found: '{schema.dest}'", is_error=True)
+        except Exception as e:
+            self.log(f"Error reading '{schema.dest}': {str(e)}", is_error=True)
+        return None
 
     @staticmethod
     def merge_openapi_specs(specs: list[dict]) -> dict:
         """
         Merges a list of OpenAPI specification dictionaries into one unified spec.
-        This basic merging algorithm:
+        This basic merging algorithm (see SpecMerger):
           - Uses the 'openapi' version and 'info' from the first spec.
           - Merges all 'paths', allowing duplicate paths by appending a numeric suffix (-1, -2, etc.).
-          - Merges 'components' by shallow-merging each component category.
+          - Merges 'components' by shallow-merging each component category,
+            collapsing structurally identical duplicates instead of suffixing them.
         """
         if not specs:
             raise ValueError("[sphinx_openapi] No specifications provided for merging.")
 
-        merged_spec = {
-            "openapi": specs[0].get("openapi", "3.0.0"),
-            "info": specs[0].get("info", {}),
-            "paths": {},
-        }
-        merged_components = {}
-
+        merger = SpecMerger()
         for spec in specs:
-            for path, path_item in spec.get("paths", {}).items():
-                unique_path = path
-                counter = 1
-                while unique_path in merged_spec["paths"]:
-                    unique_path = f"{path}-{counter}"
-                    counter += 1
-                merged_spec["paths"][unique_path] = path_item
-
-            components = spec.get("components", {})
-            for comp_key, comp_val in components.items():
-                if comp_key not in merged_components:
-                    merged_components[comp_key] = comp_val
-                else:
-                    for item_key, item_val in comp_val.items():
-                        if item_key in merged_components[comp_key]:
-                            counter = 1
-                            unique_item_key = f"{item_key}-{counter}"
-                            while unique_item_key in merged_components[comp_key]:
-                                counter += 1
-                                unique_item_key = f"{item_key}-{counter}"
-                            merged_components[comp_key][unique_item_key] = item_val
-                        else:
-                            merged_components[comp_key][item_key] = item_val
-
-        if merged_components:
-            merged_spec["components"] = merged_components
-
-        return merged_spec
+            merger.add_spec(spec)
+        return merger.merged_spec()
 
     @staticmethod
     def log(message: str, is_error: bool = False) -> None:
@@ -203,6 +1223,17 @@ class SphinxOpenApi:
         If is_error is True, the message will be shown in red with line breaks.
         """
         if is_error:
-            print(f"\n[sphinx_openapi] \033[91m{message}\033[0m\n")
+            SphinxOpenApi.emit(f"\n[sphinx_openapi] \033[91m{message}\033[0m\n")
+        else:
+            SphinxOpenApi.emit(f"[sphinx_openapi] {message}")
+
+    @staticmethod
+    def emit(line: str) -> None:
+        """
+        Prints a raw line, or appends it to the current worker's log buffer when running in parallel.
+        """
+        buffer = getattr(_log_state, "buffer", None)
+        if buffer is not None:
+            buffer.append(line)
         else:
-            print(f"[sphinx_openapi] {message}")
+            print(line)
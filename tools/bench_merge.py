@@ -0,0 +1,63 @@
+"""
+tools/bench_merge.py
+Benchmarks SpecMerger with thousands of colliding path/component keys (e.g. every service ships
+`/health` and `components.schemas.Error`). Merge time should grow linearly with the spec count.
+Usage (from the repo root): python tools/bench_merge.py [max_specs]
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from sphinx_openapi.spec_merger import SpecMerger  # noqa: E402
+
+
+def make_specs(count: int) -> list[dict]:
+    """
+    Builds `count` small specs that all share the same path and component names.
+    """
+    return [
+        {
+            "openapi": "3.0.0",
+            "info": {"title": f"service-{i}", "version": "1.0.0"},
+            "paths": {
+                "/health": {"get": {"responses": {"200": {"description": f"ok {i}"}}}},
+                f"/service-{i}": {"get": {"responses": {"200": {"description": "ok"}}}},
+            },
+            "components": {
+                "schemas": {
+                    "Error": {"type": "object", "description": f"error {i}"},
+                    "Pet": {"type": "object", "description": f"pet {i}"},
+                },
+            },
+        }
+        for i in range(count)
+    ]
+
+
+def bench(count: int) -> float:
+    """
+    Returns the seconds taken to merge `count` colliding specs.
+    """
+    specs = make_specs(count)
+    start = time.perf_counter()
+    merger = SpecMerger()
+    for spec in specs:
+        merger.add_spec(spec)
+    merger.merged_spec()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    max_specs = int(sys.argv[1]) if len(sys.argv) > 1 else 16000
+    count = 1000
+    print(f"{'specs':>8} {'seconds':>10} {'us/spec':>10}")
+    while count <= max_specs:
+        seconds = bench(count)
+        print(f"{count:>8} {seconds:>10.4f} {seconds / count * 1e6:>10.2f}")
+        count *= 2
+
+
+if __name__ == "__main__":
+    main()